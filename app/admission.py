@@ -0,0 +1,300 @@
+"""Contrôle d'admission : débit par client et concurrence bornée par étape du pipeline.
+
+Chaque client (clé ``X-API-Key`` si elle figure dans ``api_keys``, sinon
+adresse IP) dispose d'un seau à jetons partagé par les routes coûteuses ;
+au-delà, la requête reçoit une 429. L'adresse IP est celle vue par uvicorn :
+``X-Forwarded-For`` n'est pris en compte que venant d'un proxy de
+``forwarded_allow_ips``, et une clé inconnue ne crée pas de nouveau seau.
+
+Chaque étape (génération, PDF, extraction, LLM) n'exécute qu'un nombre
+borné de traitements à la fois ; les suivants attendent dans une file courte.
+Quand la file est pleine ou que l'attente estimée (profondeur de file ×
+durée moyenne mesurée) dépasse ``max_wait``, la requête est refusée tout de
+suite avec une 503 plutôt que d'allonger la latence de tout le monde. Les
+deux réponses portent un ``Retry-After``.
+
+Les compteurs sont propres à chaque processus : avec plusieurs workers, les
+limites s'appliquent par worker.
+"""
+import asyncio
+import hashlib
+import math
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, nullcontext
+from typing import AsyncIterator, Iterable
+from fastapi import Depends, HTTPException, Request
+from starlette.concurrency import iterate_in_threadpool
+from app.config import Settings, get_settings
+
+
+# Au-delà, les seaux des clients les moins récemment vus sont oubliés
+MAX_CLIENTS = 10_000
+# Poids de la dernière mesure dans les moyennes glissantes
+EWMA_ALPHA = 0.2
+
+
+class Overloaded(Exception):
+    """Étape saturée ; ``retry_after`` est l'attente estimée en secondes."""
+
+    def __init__(self, stage: str, retry_after: float):
+        super().__init__(f"Étape {stage} saturée")
+        self.stage = stage
+        self.retry_after = retry_after
+
+
+def _retry_after(seconds: float) -> str:
+    return str(max(1, math.ceil(seconds)))
+
+
+def _key_digest(key: str) -> bytes:
+    return hashlib.sha256(key.encode("utf-8")).digest()
+
+
+class TokenBucket:
+    """``rate`` jetons par seconde, jusqu'à ``burst`` jetons accumulés."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, cost: float = 1.0) -> float:
+        """Consomme ``cost`` jetons ; renvoie 0, ou le délai avant qu'ils soient disponibles."""
+        self._refill(time.monotonic())
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate if self.rate > 0 else math.inf
+
+
+class StageLimiter:
+    """File d'attente FIFO devant ``limit`` traitements simultanés.
+
+    La durée moyenne d'un traitement et de l'attente sont mesurées en continu
+    (moyennes glissantes) ; l'attente estimée d'un nouvel arrivant décide de
+    son admission.
+    """
+
+    def __init__(self, name: str, limit: int, max_queue: int, max_wait: float):
+        self.name = name
+        self.limit = max(limit, 1)
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.active = 0
+        self.waiters: deque[asyncio.Future] = deque()
+        self.service_time = 1.0
+        self.queue_time = 0.0
+        self.rejected = 0
+
+    def expected_wait(self) -> float:
+        """Attente estimée pour un nouvel arrivant (secondes)."""
+        if self.active < self.limit and not self.waiters:
+            return 0.0
+        rounds = (len(self.waiters) + 1) / self.limit
+        return rounds * self.service_time
+
+    async def acquire(self, wait: bool = True) -> None:
+        if self.active < self.limit and not self.waiters:
+            self.active += 1
+            return
+        expected = self.expected_wait()
+        if not wait or len(self.waiters) >= self.max_queue or expected > self.max_wait:
+            self.rejected += 1
+            raise Overloaded(self.name, expected)
+
+        started = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        self.waiters.append(future)
+        try:
+            await asyncio.wait_for(future, self.max_wait)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # La place a été transmise au moment de l'abandon : on la rend
+                self._hand_over()
+            if isinstance(e, asyncio.TimeoutError):
+                self.rejected += 1
+                raise Overloaded(self.name, self.expected_wait()) from None
+            raise
+        self.queue_time += EWMA_ALPHA * (time.monotonic() - started - self.queue_time)
+
+    def release(self, elapsed: float) -> None:
+        self.service_time += EWMA_ALPHA * (elapsed - self.service_time)
+        self._hand_over()
+
+    def _hand_over(self) -> None:
+        """Passe la place au premier en attente encore présent, sinon la libère."""
+        while self.waiters:
+            future = self.waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    @asynccontextmanager
+    async def slot(self, wait: bool = True) -> AsyncIterator[None]:
+        await self.acquire(wait)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(time.monotonic() - started)
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active,
+            "queued": len(self.waiters),
+            "limit": self.limit,
+            "service_time": round(self.service_time, 3),
+            "queue_time": round(self.queue_time, 3),
+            "rejected": self.rejected,
+        }
+
+
+class AdmissionController:
+    """Seaux à jetons par client et limiteurs par étape, construits depuis ``Settings``."""
+
+    def __init__(self, settings: Settings):
+        self.enabled = settings.admission_enabled
+        self.rate = settings.rate_limit_per_minute / 60
+        self.burst = settings.rate_limit_burst
+        # Empreinte de chaque clé reconnue -> rang (les clés elles-mêmes ne servent pas d'identifiant)
+        self.api_keys = {_key_digest(key): i for i, key in enumerate(settings.api_keys) if key}
+        # Du client le moins récemment vu au plus récent
+        self.buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self.stages = {
+            name: StageLimiter(name, limit, settings.admission_max_queue, settings.admission_max_wait)
+            for name, limit in (
+                ("generate", settings.generate_concurrency),
+                ("pdf", settings.pdf_concurrency),
+                ("extract", settings.extract_concurrency),
+                ("llm", settings.llm_concurrency),
+            )
+        }
+
+    def client_id(self, request: Request) -> str:
+        """Clé API reconnue, sinon adresse du client (déjà résolue derrière un proxy de confiance)."""
+        api_key = request.headers.get("x-api-key")
+        if api_key and self.api_keys:
+            rank = self.api_keys.get(_key_digest(api_key))
+            if rank is not None:
+                return f"key:{rank}"
+        return f"ip:{request.client.host if request.client else 'inconnu'}"
+
+    def check_rate(self, client: str) -> None:
+        """Lève une 429 si le client a épuisé ses jetons."""
+        bucket = self.buckets.get(client)
+        if bucket is None:
+            if len(self.buckets) >= MAX_CLIENTS:
+                self.buckets.popitem(last=False)
+            bucket = self.buckets[client] = TokenBucket(self.rate, self.burst)
+        else:
+            self.buckets.move_to_end(client)
+        delay = bucket.take()
+        if delay > 0:
+            raise HTTPException(
+                429,
+                detail="Trop de requêtes pour ce client, réessayez plus tard.",
+                headers={"Retry-After": _retry_after(delay)},
+            )
+
+    def stage(self, name: str, wait: bool = True):
+        """Contexte asynchrone occupant une place de l'étape ``name`` (lève ``Overloaded``)."""
+        if not self.enabled:
+            return nullcontext()
+        return self.stages[name].slot(wait)
+
+    def stats(self) -> dict:
+        return {name: limiter.stats() for name, limiter in self.stages.items()}
+
+
+_controller: AdmissionController | None = None
+
+
+def get_admission() -> AdmissionController:
+    """Instance partagée par toutes les requêtes du processus."""
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController(get_settings())
+    return _controller
+
+
+class StageSlot:
+    """Place obtenue dans une étape, rendue une seule fois par ``release``.
+
+    Sert aux réponses en flux : la place reste occupée jusqu'à la fin de
+    l'envoi du corps (ou la déconnexion du client), pas seulement jusqu'au
+    retour de la route. À n'utiliser que depuis la boucle d'événements.
+    """
+
+    def __init__(self, limiter: StageLimiter | None):
+        self.limiter = limiter
+        self.started = time.monotonic()
+        self.released = limiter is None
+
+    def release(self) -> None:
+        if not self.released:
+            self.released = True
+            self.limiter.release(time.monotonic() - self.started)
+
+    async def aclose(self) -> None:
+        """Version coroutine de ``release`` (tâche de fond de la réponse, exécutée dans la boucle)."""
+        self.release()
+
+    async def hold(self, chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+        """Relaie un flux synchrone (lu dans le pool de threads) et rend la place à sa fin."""
+        try:
+            async for chunk in iterate_in_threadpool(chunks):
+                yield chunk
+        finally:
+            self.release()
+
+
+async def acquire_slot(request: Request, stage: str) -> StageSlot:
+    """Limite de débit du client puis place dans l'étape ``stage`` (429 / 503 sinon).
+
+    L'appelant doit appeler ``release`` (ou confier le flux à ``hold``).
+    """
+    controller = get_admission()
+    if not controller.enabled:
+        return StageSlot(None)
+    controller.check_rate(controller.client_id(request))
+    limiter = controller.stages[stage]
+    try:
+        await limiter.acquire()
+    except Overloaded as e:
+        raise HTTPException(
+            503,
+            detail="Service surchargé, réessayez dans quelques instants.",
+            headers={"Retry-After": _retry_after(e.retry_after)},
+        )
+    return StageSlot(limiter)
+
+
+@asynccontextmanager
+async def admitted(request: Request, stage: str) -> AsyncIterator[None]:
+    """Limite de débit du client puis place dans l'étape ``stage`` (429 / 503 sinon)."""
+    slot = await acquire_slot(request, stage)
+    try:
+        yield
+    finally:
+        slot.release()
+
+
+def admit(stage: str):
+    """Dépendance FastAPI équivalente à ``admitted`` pour toute la durée du traitement.
+
+    La dépendance se termine avant l'envoi du corps : pour une ``StreamingResponse``,
+    utiliser ``acquire_slot`` et ``StageSlot.hold``.
+    """
+
+    async def dependency(request: Request) -> AsyncIterator[None]:
+        async with admitted(request, stage):
+            yield
+
+    return Depends(dependency)
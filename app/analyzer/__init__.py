@@ -1,5 +1,13 @@
 """Analyse du contenu pour extraire idées clés, chiffres et structure."""
 from .content_analyzer import analyze_content
+from .incremental import IncrementalAnalyzer, analyze_content_stream
+from .boilerplate import BoilerplateFilter
 from app.models import DocumentAnalysis
 
-__all__ = ["analyze_content", "DocumentAnalysis"]
+__all__ = [
+    "analyze_content",
+    "analyze_content_stream",
+    "IncrementalAnalyzer",
+    "BoilerplateFilter",
+    "DocumentAnalysis",
+]
@@ -0,0 +1,135 @@
+"""Suppression des en-têtes, pieds de page et mentions répétés de page en page."""
+import hashlib
+import re
+from collections import Counter
+from typing import Iterable, Iterator
+from app.models import ExtractedChunk
+
+
+PATTERN_DIGITS = re.compile(r"\d+")
+PATTERN_SPACES = re.compile(r"\s+")
+# Numéro de page seul : « 3 », « - 3 - », « Page 3 », « 3/12 », « Page 3 sur 12 »
+PATTERN_PAGE_NUMBER = re.compile(
+    r"^[-–—\s]*(?:(?:page|p\.)\s*)?\d+(?:\s*(?:/|sur|of|de)\s*\d+)?[-–—\s]*$", re.IGNORECASE
+)
+# Numéro de page séparé du reste d'un en-tête : « Rapport annuel — Page 3 / 12 », « p. 3 | Titre »
+PATTERN_PAGE_REF = re.compile(
+    r"(?:[-–—|•·:]\s*(?:page|p\.)\s*\d+(?:\s*(?:/|sur|of|de)\s*\d+)?\s*$)"
+    r"|(?:^(?:page|p\.)\s*\d+(?:\s*(?:/|sur|of|de)\s*\d+)?\s*[-–—|•·:])",
+    re.IGNORECASE,
+)
+# Caractères d'un chiffre, d'un pourcentage ou d'un montant
+PATTERN_FIGURE_CHARS = re.compile(r"[\d%€$£.,+\-]")
+
+# Pages mises en tampon avant de commencer à filtrer
+WARMUP_CHUNKS = 6
+# Une ligne est répétitive si elle apparaît sur au moins MIN_REPEATS fragments
+# et sur au moins REPEAT_RATIO des fragments déjà vus
+MIN_REPEATS = 3
+REPEAT_RATIO = 0.5
+# Les paragraphes très longs ne sont jamais considérés comme des en-têtes
+MAX_LINE_CHARS = 400
+# Les numéros de page ne sont neutralisés que sur les lignes courtes
+SHORT_LINE_CHARS = 80
+# Au-delà de cette part de chiffres, symboles % et monétaires, la ligne est une donnée
+FIGURE_RATIO = 0.5
+
+
+def _is_page_number(line: str) -> bool:
+    return PATTERN_PAGE_NUMBER.match(line) is not None
+
+
+def _is_figure(line: str) -> bool:
+    """Ligne faite surtout de chiffres, pourcentages ou montants (jamais retirée)."""
+    compact = "".join(line.split())
+    return bool(compact) and len(PATTERN_FIGURE_CHARS.findall(compact)) >= FIGURE_RATIO * len(compact)
+
+
+def _fingerprint(line: str) -> int:
+    """Empreinte 64 bits d'une ligne normalisée (casse, espaces, numéros de page).
+
+    Seuls les numéros de page sont neutralisés, pour que « Page 3 / 40 » et
+    « Page 4 / 40 » aient la même empreinte ; les autres chiffres comptent,
+    « Total : 1 200 € » et « Total : 980 € » restent des lignes différentes.
+    """
+    normalized = PATTERN_SPACES.sub(" ", line.strip().lower())
+    if len(normalized) <= SHORT_LINE_CHARS:
+        if _is_page_number(normalized):
+            normalized = PATTERN_DIGITS.sub("#", normalized)
+        else:
+            normalized = PATTERN_PAGE_REF.sub(lambda m: PATTERN_DIGITS.sub("#", m.group()), normalized)
+    return int.from_bytes(hashlib.blake2b(normalized.encode(), digest_size=8).digest(), "big")
+
+
+class BoilerplateFilter:
+    """Retire des pages les lignes qui se répètent sur la plupart d'entre elles.
+
+    Le filtre compte, pour chaque empreinte de ligne, le nombre de pages
+    où elle apparaît. Les premières pages sont gardées en tampon le temps
+    d'apprendre les répétitions, puis le filtrage se fait au fil de l'eau.
+    Seuls les fragments ``kind == "page"`` (PDF) sont concernés : sections
+    et diapositives passent telles quelles. Les lignes de chiffres,
+    pourcentages ou montants ne sont jamais retirées.
+    ``removed_bytes`` indique le volume (UTF-8) supprimé.
+    """
+
+    def __init__(self, warmup: int = WARMUP_CHUNKS, min_repeats: int = MIN_REPEATS, ratio: float = REPEAT_RATIO):
+        self.warmup = warmup
+        self.min_repeats = min_repeats
+        self.ratio = ratio
+        self.counts: Counter[int] = Counter()
+        self.seen = 0
+        self.removed_bytes = 0
+
+    def _learn(self, text: str) -> None:
+        self.seen += 1
+        self.counts.update({
+            _fingerprint(line)
+            for line in text.split("\n")
+            if line.strip() and len(line) <= MAX_LINE_CHARS
+        })
+
+    def _is_boilerplate(self, line: str) -> bool:
+        if not line.strip() or len(line) > MAX_LINE_CHARS:
+            return False
+        if _is_figure(line) and not _is_page_number(line):
+            return False
+        threshold = max(self.min_repeats, self.ratio * self.seen)
+        return self.counts[_fingerprint(line)] >= threshold
+
+    def clean(self, text: str) -> str:
+        """Retire les lignes répétitives déjà apprises."""
+        kept = []
+        for line in text.split("\n"):
+            if self._is_boilerplate(line):
+                self.removed_bytes += len(line.encode()) + 1
+            else:
+                kept.append(line)
+        return "\n".join(kept).strip()
+
+    def _cleaned(self, chunk: ExtractedChunk) -> ExtractedChunk:
+        if chunk.kind != "page":
+            return chunk
+        return chunk.model_copy(update={"text": self.clean(chunk.text)})
+
+    def filter(self, chunks: Iterable[ExtractedChunk]) -> Iterator[ExtractedChunk]:
+        """Applique le filtre à un flux de fragments, en préservant l'ordre."""
+        buffer: list[ExtractedChunk] | None = []
+        for chunk in chunks:
+            if chunk.kind != "page" and not buffer:
+                # Rien en attente : sections et diapositives ne sont pas retenues
+                yield chunk
+                continue
+            if chunk.kind == "page":
+                self._learn(chunk.text)
+            if buffer is None:
+                yield self._cleaned(chunk)
+                continue
+            buffer.append(chunk)
+            if self.seen < self.warmup:
+                continue
+            for buffered in buffer:
+                yield self._cleaned(buffered)
+            buffer = None
+        for buffered in buffer or ():
+            yield self._cleaned(buffered)
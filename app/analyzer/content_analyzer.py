@@ -7,9 +7,13 @@ from app.models import (
     TimelineItem,
     ExtractedContent,
 )
+from app.admission import get_admission
 from app.config import get_settings
 
 
+# Taille du texte envoyé au LLM
+LLM_INPUT_CHARS = 8000
+
 # Patterns pour extraction heuristique
 PATTERN_NUMBER = re.compile(
     r"(?:^|\s)([0-9]+(?:\s*[.,]\s*[0-9]+)*)\s*%?(?:\s*(?:millions?|milliards?|M|k|K|€|\$|euros?|dollars?))?(?=\s|$|[.,;:])",
@@ -147,6 +151,14 @@ def _extract_key_ideas(text: str, sections: list) -> list[KeyIdea]:
             icon = _get_icon_for_idea(idea_text)
             ideas.append(KeyIdea(text=idea_text, importance="high", icon=icon))
     
+    if len(ideas) > 12:
+        # Trop de candidats : on garde les plus représentatifs du document
+        try:
+            from .summarizer import rank_candidates
+            order = rank_candidates(text, [idea.text for idea in ideas])
+            ideas = [ideas[i] for i in sorted(order[:12])]
+        except ImportError:
+            pass
     return ideas[:12]
 
 
@@ -163,7 +175,15 @@ def _build_chart_data(key_figures: list[KeyFigure]) -> dict | None:
 
 
 def _extract_summary(text: str, sections: list) -> str:
-    """Génère un résumé en prenant le début des sections principales."""
+    """Résumé extractif (TF-IDF + centralité) si NumPy est disponible, sinon début des sections."""
+    try:
+        from .summarizer import summarize
+        summary = summarize(text)
+        if summary:
+            return summary
+    except ImportError:
+        pass
+
     summary_parts = []
     
     # Première phrase du texte (souvent le chapeau)
@@ -190,18 +210,24 @@ def _extract_summary(text: str, sections: list) -> str:
     return final_summary or (text[:300] + "...")
 
 
+def _choose_title(title: str | None, sections: list) -> str:
+    """Titre des métadonnées, sinon premier titre de section s'il est court."""
+    title = (title or "").strip()
+    if not title and sections:
+        # Si pas de métadonnée titre, on prend le premier titre de section s'il est court
+        first_sec_title = (sections[0].get("title") or "").strip()
+        if first_sec_title and len(first_sec_title) < 60:
+            title = first_sec_title
+    return title
+
+
 def _analyze_heuristic(content: ExtractedContent) -> DocumentAnalysis:
     """Analyse heuristique améliorée sans API externe."""
     text = content.raw_text.strip()
     sections = content.sections or []
     
     # Titre intelligent
-    title = (content.title or "").strip()
-    if not title and sections:
-        # Si pas de métadonnée titre, on prend le premier titre de section s'il est court
-        first_sec_title = sections[0].get("title", "").strip()
-        if first_sec_title and len(first_sec_title) < 60:
-            title = first_sec_title
+    title = _choose_title(content.title, sections)
             
     # Résumé intelligent
     summary = _extract_summary(text, sections)
@@ -221,7 +247,8 @@ def _analyze_heuristic(content: ExtractedContent) -> DocumentAnalysis:
 async def _analyze_with_openai(content: ExtractedContent) -> DocumentAnalysis | None:
     """Analyse avec OpenAI si la clé API est configurée."""
     settings = get_settings()
-    if not settings.openai_api_key or len(content.raw_text) < 50:
+    # Documents courts : le résumé extractif hors ligne suffit
+    if not settings.openai_api_key or len(content.raw_text) < settings.llm_min_chars:
         return None
     
     try:
@@ -238,11 +265,13 @@ Réponds UNIQUEMENT avec ces lignes, sans autre texte.
 
 TEXTE:
 """
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt + content.raw_text[:8000]}],
-            max_tokens=1500,
-        )
+        # LLM saturé : pas d'attente, l'analyse heuristique prend le relais
+        async with get_admission().stage("llm", wait=False):
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt + content.raw_text[:LLM_INPUT_CHARS]}],
+                max_tokens=1500,
+            )
         reply = (response.choices[0].message.content or "").strip()
         return _parse_openai_reply(reply, content)
     except Exception:
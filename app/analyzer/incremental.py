@@ -0,0 +1,141 @@
+"""Analyse incrémentale : consomme les fragments au fil de l'extraction."""
+from typing import Iterable
+from starlette.concurrency import run_in_threadpool
+from app.config import get_settings
+from app.models import (
+    DocumentAnalysis,
+    ExtractedChunk,
+    ExtractedContent,
+    KeyFigure,
+    KeyIdea,
+    TimelineItem,
+)
+from .content_analyzer import (
+    LLM_INPUT_CHARS,
+    _analyze_with_openai,
+    _build_chart_data,
+    _choose_title,
+    _extract_key_figures,
+    _extract_key_ideas,
+    _extract_structure,
+    _extract_summary,
+    _extract_timeline,
+)
+
+
+# Mêmes plafonds que l'analyse complète
+MAX_IDEAS = 12
+MAX_FIGURES = 15
+MAX_TIMELINE = 10
+
+
+class IncrementalAnalyzer:
+    """Accumule idées, chiffres et chronologie fragment par fragment.
+
+    ``feed`` renvoie True dès que l'infographie est pleine (idées et chiffres
+    au plafond, et au moins ``min_chars`` de texte retenu) : le reste du
+    document n'a alors plus besoin d'être parsé.
+    """
+
+    def __init__(self, min_chars: int = 0):
+        self.min_chars = min_chars
+        self.title: str | None = None
+        self.text_parts: list[str] = []
+        self.sections: list[dict] = []
+        self.ideas: list[KeyIdea] = []
+        self.figures: list[KeyFigure] = []
+        self.timeline: dict[str, TimelineItem] = {}
+        self.chars = 0
+        self._seen_ideas: set[str] = set()
+        self._seen_figures: set[tuple[str, str]] = set()
+
+    @property
+    def enough(self) -> bool:
+        return (
+            len(self.ideas) >= MAX_IDEAS
+            and len(self.figures) >= MAX_FIGURES
+            and self.chars >= self.min_chars
+        )
+
+    def feed(self, chunk: ExtractedChunk) -> bool:
+        """Intègre un fragment ; renvoie True quand l'analyse peut s'arrêter."""
+        self.title = self.title or chunk.document_title
+        text = chunk.text.strip()
+        chunk_sections = []
+        if chunk.title:
+            # Un titre sans texte (titre suivi d'un sous-titre) reste une section, comme dans extract()
+            chunk_sections.append({"title": chunk.title, "content": [text] if text else []})
+            self.sections.extend(chunk_sections)
+        if not text:
+            if chunk_sections and len(self.ideas) < MAX_IDEAS:
+                self._add_ideas(_extract_key_ideas("", chunk_sections))
+            return self.enough
+        self.text_parts.append(text)
+        self.chars += len(text)
+
+        if len(self.ideas) < MAX_IDEAS:
+            self._add_ideas(_extract_key_ideas(text, chunk_sections))
+        if len(self.figures) < MAX_FIGURES:
+            for figure in _extract_key_figures(text):
+                key = (figure.label[:30], figure.value)
+                if key not in self._seen_figures:
+                    self._seen_figures.add(key)
+                    self.figures.append(figure)
+        for item in _extract_timeline(text):
+            self.timeline.setdefault(item.date_or_step, item)
+        return self.enough
+
+    def _add_ideas(self, ideas: list[KeyIdea]) -> None:
+        for idea in ideas:
+            key = idea.text.lower()
+            if key not in self._seen_ideas:
+                self._seen_ideas.add(key)
+                self.ideas.append(idea)
+
+    def consume(self, chunks: Iterable[ExtractedChunk]) -> "IncrementalAnalyzer":
+        """Lit les fragments jusqu'à épuisement ou jusqu'à avoir assez de matière."""
+        iterator = iter(chunks)
+        try:
+            for chunk in iterator:
+                if self.feed(chunk):
+                    break
+        finally:
+            # Arrête le parsing du reste du document
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        return self
+
+    def to_content(self) -> ExtractedContent:
+        """Contenu retenu, au format attendu par l'analyse LLM."""
+        return ExtractedContent(raw_text="\n\n".join(self.text_parts), title=self.title, sections=self.sections)
+
+    def result(self) -> DocumentAnalysis:
+        text = "\n\n".join(self.text_parts)
+        figures = self.figures[:MAX_FIGURES]
+        timeline = sorted(self.timeline.values(), key=lambda x: x.date_or_step)
+        return DocumentAnalysis(
+            title=_choose_title(self.title, self.sections) or None,
+            summary=_extract_summary(text, self.sections),
+            key_ideas=self.ideas[:MAX_IDEAS],
+            key_figures=figures,
+            timeline=timeline[:MAX_TIMELINE],
+            structure=_extract_structure(self.sections),
+            categories_for_chart=_build_chart_data(figures),
+            raw_text=text,
+        )
+
+
+async def analyze_content_stream(chunks: Iterable[ExtractedChunk]) -> DocumentAnalysis:
+    """Analyse les fragments au fur et à mesure qu'ils sont extraits.
+
+    Le parsing et l'analyse heuristique avancent ensemble dans un thread de
+    travail ; avec une clé OpenAI, la lecture s'arrête aussi dès que le texte
+    envoyé au LLM est disponible et que l'heuristique de repli est complète.
+    """
+    min_chars = LLM_INPUT_CHARS if get_settings().openai_api_key else 0
+    analyzer = await run_in_threadpool(IncrementalAnalyzer(min_chars).consume, chunks)
+    analysis = await _analyze_with_openai(analyzer.to_content())
+    if analysis is not None:
+        return analysis
+    return analyzer.result()
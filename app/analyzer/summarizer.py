@@ -0,0 +1,204 @@
+"""Résumé extractif hors ligne : TF-IDF par phrase et centralité, vectorisés avec NumPy."""
+import hashlib
+import re
+import numpy as np
+
+
+PATTERN_PARAGRAPH = re.compile(r"\n\s*\n")
+PATTERN_HEADING_LINE = re.compile(r"^\s*#+.*$", re.MULTILINE)
+PATTERN_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+(?=[A-ZÀ-ÖØ-Þ0-9«\"“])")
+PATTERN_TOKEN = re.compile(r"[a-zà-öø-ÿ]{3,}")
+
+STOPWORDS = frozenset("""
+les des une est que qui dans pour par sur avec son ses aux pas plus ont été sont cette ces
+leur leurs mais comme tout tous toute toutes elle elles ils nous vous fait faire être avoir
+entre aussi ainsi donc dont sans sous lors afin peut peuvent très bien même autres autre
+the and for that with this are was were from have has not but all can its our their which
+""".split())
+
+# Bornes : au-delà, les phrases sont échantillonnées régulièrement dans le document
+MAX_SENTENCES = 20_000
+# Au-delà de MAX_SAMPLE_CHARS, seules des fenêtres de WINDOW_CHARS réparties dans le texte
+# sont découpées en phrases (le découpage du texte entier coûterait plus que tout le reste)
+MAX_SAMPLE_CHARS = 2_000_000
+WINDOW_CHARS = 4_000
+# Nombre de phrases les plus centrales soumises au TextRank
+TEXTRANK_CANDIDATES = 300
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_ITERATIONS = 30
+MIN_SENTENCE_CHARS = 40
+MAX_SENTENCE_CHARS = 400
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Découpe en phrases ; les retours à la ligne internes aux paragraphes sont ignorés."""
+    sentences = []
+    # Les titres Markdown ne sont pas des phrases et se colleraient à la suivante
+    text = PATTERN_HEADING_LINE.sub("\n", text)
+    for paragraph in PATTERN_PARAGRAPH.split(text):
+        paragraph = " ".join(paragraph.split())
+        if paragraph:
+            sentences.extend(s.strip() for s in PATTERN_SENTENCE_END.split(paragraph) if s.strip())
+    return sentences
+
+
+def _sample_sentences(text: str) -> list[str]:
+    """Phrases du texte, ou de fenêtres régulières si le texte est très long.
+
+    Dans une fenêtre, la première et la dernière phrase, coupées par les bords,
+    sont écartées (sauf au tout début et à la toute fin du texte).
+    """
+    if len(text) <= MAX_SAMPLE_CHARS:
+        return _split_sentences(text)
+    windows = MAX_SAMPLE_CHARS // WINDOW_CHARS
+    step = (len(text) - WINDOW_CHARS) / (windows - 1)
+    sentences: list[str] = []
+    for i in range(windows):
+        start = int(i * step)
+        parts = _split_sentences(text[start:start + WINDOW_CHARS])
+        first = 0 if i == 0 else 1
+        last = len(parts) if i == windows - 1 else len(parts) - 1
+        sentences.extend(parts[first:last])
+    return sentences
+
+
+def _tokens(sentence: str) -> list[str]:
+    return [t for t in PATTERN_TOKEN.findall(sentence.lower()) if t not in STOPWORDS]
+
+
+class ExtractiveSummarizer:
+    """Matrice TF-IDF (phrases × termes) en représentation creuse et scores de centralité.
+
+    Chaque phrase reçoit un score de similarité cosinus avec le centroïde du
+    document ; les phrases les plus centrales sont ensuite départagées par un
+    TextRank sur leur matrice de similarité dense.
+    """
+
+    def __init__(self, text: str):
+        sentences = _sample_sentences(text)
+        if len(sentences) > MAX_SENTENCES:
+            step = len(sentences) / MAX_SENTENCES
+            sentences = [sentences[int(i * step)] for i in range(MAX_SENTENCES)]
+        self.sentences = sentences
+        self.vocab: dict[str, int] = {}
+
+        rows: list[int] = []
+        cols: list[int] = []
+        vocab = self.vocab
+        for i, sentence in enumerate(sentences):
+            for token in _tokens(sentence):
+                j = vocab.get(token)
+                if j is None:
+                    j = vocab[token] = len(vocab)
+                rows.append(i)
+                cols.append(j)
+
+        n, v = len(sentences), max(len(vocab), 1)
+        # Comptage (phrase, terme) -> tf, sans matrice dense
+        keys, tf = np.unique(np.asarray(rows, dtype=np.int64) * v + np.asarray(cols, dtype=np.int64), return_counts=True)
+        self.rows = (keys // v).astype(np.int64)
+        self.cols = (keys % v).astype(np.int64)
+        df = np.bincount(self.cols, minlength=v)
+        self.idf = np.log((n + 1) / (df + 1)) + 1.0
+        weights = (1.0 + np.log(tf)) * self.idf[self.cols]
+        norms = np.sqrt(np.bincount(self.rows, weights=weights ** 2, minlength=n))
+        norms[norms == 0] = 1.0
+        self.weights = weights / norms[self.rows]
+        self.centroid = np.bincount(self.cols, weights=self.weights, minlength=v) / max(n, 1)
+        centroid_norm = np.linalg.norm(self.centroid) or 1.0
+        self.centrality = np.bincount(
+            self.rows, weights=self.weights * self.centroid[self.cols], minlength=n
+        ) / centroid_norm
+
+    def _textrank(self, candidates: np.ndarray) -> np.ndarray:
+        """Scores TextRank des phrases candidates (matrice de similarité dense)."""
+        mask = np.isin(self.rows, candidates)
+        local_rows = np.searchsorted(candidates, self.rows[mask])
+        terms, local_cols = np.unique(self.cols[mask], return_inverse=True)
+        matrix = np.zeros((len(candidates), len(terms)))
+        matrix[local_rows, local_cols] = self.weights[mask]
+        similarity = matrix @ matrix.T
+        np.fill_diagonal(similarity, 0.0)
+        out_degree = similarity.sum(axis=1, keepdims=True)
+        out_degree[out_degree == 0] = 1.0
+        transition = similarity / out_degree
+        m = len(candidates)
+        scores = np.full(m, 1.0 / m)
+        for _ in range(TEXTRANK_ITERATIONS):
+            scores = (1 - TEXTRANK_DAMPING) / m + TEXTRANK_DAMPING * (transition.T @ scores)
+        return scores
+
+    def top_sentences(self, k: int = 3) -> list[str]:
+        """Les k phrases les plus représentatives, dans l'ordre du document."""
+        lengths = np.fromiter((len(s) for s in self.sentences), dtype=np.int64, count=len(self.sentences))
+        eligible = np.flatnonzero((lengths >= MIN_SENTENCE_CHARS) & (lengths <= MAX_SENTENCE_CHARS))
+        if eligible.size == 0:
+            return []
+        order = eligible[np.argsort(-self.centrality[eligible], kind="stable")]
+        candidates = np.sort(order[:TEXTRANK_CANDIDATES])
+        if candidates.size > k:
+            scores = self._textrank(candidates) * self.centrality[candidates]
+            chosen = candidates[np.argsort(-scores, kind="stable")[:k]]
+        else:
+            chosen = candidates
+        return [self.sentences[i] for i in np.sort(chosen)]
+
+    def summary(self, max_sentences: int = 3, max_chars: int = 400) -> str:
+        parts: list[str] = []
+        size = 0
+        for sentence in self.top_sentences(max_sentences):
+            if parts and size + len(sentence) + 1 > max_chars:
+                break
+            parts.append(sentence)
+            size += len(sentence) + 1
+        summary = " ".join(parts)
+        if len(summary) > max_chars:
+            summary = summary[: max_chars - 3] + "..."
+        return summary
+
+    def score(self, texts: list[str]) -> np.ndarray:
+        """Similarité cosinus de chaque texte avec le centroïde du document."""
+        centroid_norm = np.linalg.norm(self.centroid) or 1.0
+        scores = np.zeros(len(texts))
+        for i, text in enumerate(texts):
+            ids = [self.vocab[t] for t in _tokens(text) if t in self.vocab]
+            if not ids:
+                continue
+            ids_arr, counts = np.unique(np.asarray(ids, dtype=np.int64), return_counts=True)
+            weights = (1.0 + np.log(counts)) * self.idf[ids_arr]
+            norm = np.linalg.norm(weights) or 1.0
+            scores[i] = float(weights @ self.centroid[ids_arr]) / (norm * centroid_norm)
+        return scores
+
+
+# Dernier modèle construit, indexé par l'empreinte du texte (pas par le texte lui-même)
+_last: tuple[bytes, ExtractiveSummarizer] | None = None
+
+
+def get_summarizer(text: str) -> ExtractiveSummarizer:
+    """Modèle TF-IDF du texte, partagé entre résumé et classement des idées.
+
+    Un seul modèle est gardé : celui de l'analyse en cours, réutilisé par
+    ``summarize`` et ``rank_candidates`` ; il est remplacé à l'analyse suivante.
+    """
+    global _last
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    cached = _last
+    if cached is not None and cached[0] == digest:
+        return cached[1]
+    summarizer = ExtractiveSummarizer(text)
+    _last = (digest, summarizer)
+    return summarizer
+
+
+def summarize(text: str, max_sentences: int = 3, max_chars: int = 400) -> str:
+    """Résumé extractif : les phrases les plus centrales du document."""
+    return get_summarizer(text).summary(max_sentences, max_chars)
+
+
+def rank_candidates(text: str, candidates: list[str]) -> list[int]:
+    """Indices des candidats, du plus au moins représentatif du document."""
+    if not candidates:
+        return []
+    scores = get_summarizer(text).score(candidates)
+    return [int(i) for i in np.argsort(-scores, kind="stable")]
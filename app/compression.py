@@ -0,0 +1,82 @@
+"""Compression des réponses selon ``Accept-Encoding`` (brotli si disponible, sinon gzip)."""
+import zlib
+from typing import Iterable, Iterator
+
+
+# En dessous, une réponse complète n'est pas compressée (l'en-tête gzip coûterait plus qu'il ne rapporte)
+MIN_COMPRESS_SIZE = 1024
+GZIP_LEVEL = 6
+# Qualité brotli modérée : bon ratio sans ralentir le flux
+BROTLI_QUALITY = 5
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """``"br"``, ``"gzip"`` ou ``None`` d'après l'en-tête ``Accept-Encoding`` du client."""
+    accepted: dict[str, float] = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+
+    def quality(encoding: str) -> float:
+        return accepted.get(encoding, accepted.get("*", 0.0))
+
+    if quality("br") > 0 and _brotli() is not None:
+        return "br"
+    if quality("gzip") > 0:
+        return "gzip"
+    return None
+
+
+def compress_stream(chunks: Iterable[bytes], encoding: str | None) -> Iterator[bytes]:
+    """Compresse un flux en vidant le compresseur après chaque bloc.
+
+    Chaque bloc (une ligne NDJSON, par exemple) est donc décodable par le
+    client dès sa réception, au prix d'un ratio un peu moindre.
+    """
+    if encoding is None:
+        yield from chunks
+        return
+    if encoding == "br":
+        brotli = _brotli()
+        compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+        for chunk in chunks:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+        return
+    # wbits=31 : format gzip (en-tête + CRC), compatible Content-Encoding: gzip
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def compress_bytes(data: bytes, encoding: str | None) -> tuple[bytes, str | None]:
+    """Compresse une réponse complète ; renvoie le corps et l'encodage réellement appliqué."""
+    if encoding is None or len(data) < MIN_COMPRESS_SIZE:
+        return data, None
+    if encoding == "br":
+        brotli = _brotli()
+        return brotli.compress(data, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY), "br"
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush(), "gzip"
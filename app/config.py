@@ -1,5 +1,6 @@
 """Configuration de l'application."""
 from pathlib import Path
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,9 +8,66 @@ class Settings(BaseSettings):
     """Paramètres de l'application."""
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
+    # Serveur : "development" (un processus, rechargement auto) ou "production"
+    # (gunicorn + workers uvicorn ; WORKERS=0 pour un worker par CPU)
+    server_mode: Literal["development", "production"] = "development"
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = 0
+    # Délai (s) laissé aux requêtes en cours à l'arrêt, et avant de relancer un worker bloqué
+    graceful_timeout: int = 30
+    worker_timeout: int = 120
+
     openai_api_key: str = ""
+    # En dessous de cette taille (environ une page), l'analyse reste hors ligne (pas d'appel au LLM)
+    llm_min_chars: int = 2000
     upload_dir: Path = Path("uploads")
     output_dir: Path = Path("output")
+    # Conserver une copie des fichiers uploadés (/extract-text : écrite pendant l'extraction,
+    # avant la fin de la réponse ; /generate : en tâche de fond après la réponse)
+    persist_uploads: bool = True
+
+    # Stockage des uploads et artefacts : disque local (UPLOAD_DIR / OUTPUT_DIR) ou S3
+    # (bucket partagé entre plusieurs nœuds ; S3_ENDPOINT_URL pour MinIO ou équivalent)
+    storage_backend: Literal["local", "s3"] = "local"
+    s3_bucket: str = ""
+    s3_prefix: str = ""
+    s3_endpoint_url: str | None = None
+    s3_region: str | None = None
+    s3_access_key: str = ""
+    s3_secret_key: str = ""
+    # Cache disque local des objets S3 (désactivé si non défini), revalidé après TTL secondes
+    storage_cache_dir: Path | None = None
+    storage_cache_ttl: int = 30
+    storage_cache_max_mb: int = 1024
+
+    # Contrôle d'admission (par worker) : débit par client (clé API reconnue ou IP) sur les
+    # routes coûteuses, traitements simultanés par étape, file d'attente bornée
+    admission_enabled: bool = True
+    # Clés acceptées dans X-API-Key ; une clé absente de la liste est ignorée (limite par IP)
+    api_keys: list[str] = []
+    # Proxys dont X-Forwarded-For est cru pour l'adresse du client ("*" : tous)
+    forwarded_allow_ips: str = "127.0.0.1"
+    rate_limit_per_minute: int = 30
+    rate_limit_burst: int = 10
+    generate_concurrency: int = 4
+    pdf_concurrency: int = 2
+    extract_concurrency: int = 8
+    llm_concurrency: int = 4
+    admission_max_queue: int = 16
+    # Attente maximale estimée (s) avant de refuser avec une 503
+    admission_max_wait: float = 20.0
+
+    # Vignettes PNG : générées avec l'infographie (sinon à la première demande)
+    thumbnails_on_generate: bool = False
+
+    # Génération PDF : hôtes distants autorisés (le reste est refusé sans attendre le réseau).
+    # Vide par défaut : polices de app/static/fonts (scripts/fetch_fonts.py) ou polices système
+    pdf_allowed_hosts: list[str] = []
+    pdf_fetch_timeout: float = 3.0
+    # Cache disque des ressources distantes et durée de validité (secondes)
+    asset_cache_dir: Path = Path("cache")
+    asset_cache_ttl: int = 7 * 24 * 3600
 
 
 def get_settings() -> Settings:
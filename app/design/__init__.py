@@ -1,4 +1,4 @@
 """Système de design automatique pour les infographies."""
-from .theme import Theme, get_theme_for_analysis
+from .theme import THEMES, Theme, get_theme_for_analysis, get_theme_by_name
 
-__all__ = ["Theme", "get_theme_for_analysis"]
+__all__ = ["THEMES", "Theme", "get_theme_for_analysis", "get_theme_by_name"]
@@ -125,3 +125,12 @@ def get_theme_for_analysis(analysis: DocumentAnalysis) -> Theme:
     seed = (analysis.title or "") + (analysis.summary or "")[:200]
     h = int(hashlib.sha256(seed.encode()).hexdigest(), 16)
     return THEMES[h % len(THEMES)]
+
+
+def get_theme_by_name(name: str) -> Theme | None:
+    """Retrouve un thème par son nom (insensible à la casse)."""
+    wanted = name.strip().lower()
+    for theme in THEMES:
+        if theme.name.lower() == wanted:
+            return theme
+    return None
@@ -1,6 +1,26 @@
 """Extracteurs de contenu pour différents formats de documents."""
 from app.models import ExtractedContent
-from .base import BaseExtractor
-from .registry import get_extractor, extract_from_file
+from .base import BaseExtractor, Source
+from .selection import ChunkSelector, parse_page_ranges
+from .registry import (
+    get_extractor,
+    extract_from_file,
+    extract_from_buffer,
+    iter_extract,
+    register_extractor,
+    supported_extensions,
+)
 
-__all__ = ["BaseExtractor", "ExtractedContent", "get_extractor", "extract_from_file"]
+__all__ = [
+    "BaseExtractor",
+    "ChunkSelector",
+    "ExtractedContent",
+    "Source",
+    "get_extractor",
+    "extract_from_file",
+    "extract_from_buffer",
+    "iter_extract",
+    "parse_page_ranges",
+    "register_extractor",
+    "supported_extensions",
+]
@@ -1,6 +1,45 @@
 """Classe de base pour les extracteurs de documents."""
+import io
 from pathlib import Path
-from app.models import ExtractedContent
+from typing import BinaryIO, Iterator, Union
+from app.models import ExtractedChunk, ExtractedContent
+
+
+# Un document peut être lu depuis le disque ou directement depuis la mémoire
+Source = Union[Path, bytes, bytearray, memoryview, BinaryIO]
+
+
+def open_source(source: Source) -> Union[str, BinaryIO]:
+    """Adapte la source à ce qu'acceptent pypdf, python-docx, python-pptx et zipfile.
+
+    Les chemins sont passés tels quels ; les octets sont enveloppés dans un
+    ``BytesIO`` sans copie quand c'est possible (``bytes`` ou vue pleine sur
+    des ``bytes``) ; les objets fichier sont rembobinés.
+    """
+    if isinstance(source, Path):
+        return str(source)
+    if isinstance(source, memoryview):
+        if isinstance(source.obj, bytes) and source.contiguous and source.nbytes == len(source.obj):
+            return io.BytesIO(source.obj)
+        return io.BytesIO(source)
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    if source.seekable():
+        source.seek(0)
+    return source
+
+
+def read_source(source: Source) -> bytes:
+    """Retourne le contenu brut de la source."""
+    if isinstance(source, Path):
+        return source.read_bytes()
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return bytes(source)
+    if source.seekable():
+        source.seek(0)
+    return source.read()
 
 
 class BaseExtractor:
@@ -13,5 +52,15 @@ class BaseExtractor:
     def can_handle(self, path: Path) -> bool:
         return path.suffix.lower() in self.supported_extensions
     
-    def extract(self, path: Path) -> ExtractedContent:
+    def extract(self, source: Source) -> ExtractedContent:
+        """Extrait le contenu d'un chemin, d'octets ou d'un objet fichier."""
         raise NotImplementedError
+
+    def iter_chunks(self, source: Source) -> Iterator[ExtractedChunk]:
+        """Produit le document fragment par fragment, au fil du parsing.
+
+        Par défaut, extrait tout puis renvoie un fragment unique ; les
+        extracteurs capables de lire page par page surchargent cette méthode.
+        """
+        content = self.extract(source)
+        yield ExtractedChunk(index=1, text=content.raw_text, document_title=content.title)
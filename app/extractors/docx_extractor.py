@@ -1,40 +1,60 @@
 """Extracteur pour fichiers Word (.docx)."""
-from pathlib import Path
+from typing import Iterator
 from docx import Document as DocxDocument
-from app.models import ExtractedContent
-from .base import BaseExtractor
+from app.models import ExtractedChunk, ExtractedContent
+from .base import BaseExtractor, Source, open_source
+
+
+def _iter_blocks(doc) -> Iterator[tuple[str | None, list[str]]]:
+    """(titre, paragraphes) pour chaque bloc délimité par un style de titre."""
+    heading = None
+    paragraphs: list[str] = []
+    for para in doc.paragraphs:
+        text = para.text.strip()
+        if not text:
+            continue
+        style = para.style.name if para.style else ""
+        if "Heading" in style or "Titre" in style:
+            if heading is not None or paragraphs:
+                yield heading, paragraphs
+            heading = text
+            paragraphs = []
+        else:
+            paragraphs.append(text)
+    if heading is not None or paragraphs:
+        yield heading, paragraphs
 
 
 class DocxExtractor(BaseExtractor):
     """Extrait le texte et la structure des fichiers Word."""
-    
+
     @property
     def supported_extensions(self) -> list[str]:
         return [".docx", ".doc"]
-    
-    def extract(self, path: Path) -> ExtractedContent:
-        doc = DocxDocument(str(path))
+
+    def extract(self, source: Source) -> ExtractedContent:
+        doc = DocxDocument(open_source(source))
         sections = []
-        current_section = None
         text_parts = []
-        
-        for para in doc.paragraphs:
-            text = para.text.strip()
-            if not text:
-                continue
-            style = para.style.name if para.style else ""
-            if "Heading" in style or "Titre" in style:
-                if current_section:
-                    sections.append(current_section)
-                current_section = {"title": text, "content": []}
-            else:
-                if current_section:
-                    current_section["content"].append(text)
-                text_parts.append(text)
-        
-        if current_section:
-            sections.append(current_section)
-        
+
+        for heading, paragraphs in _iter_blocks(doc):
+            if heading is not None:
+                sections.append({"title": heading, "content": paragraphs})
+            text_parts.extend(paragraphs)
+
         title = doc.core_properties.title or (sections[0]["title"] if sections else None)
         raw_text = "\n\n".join(text_parts)
         return ExtractedContent(raw_text=raw_text, title=title, sections=sections)
+
+    def iter_chunks(self, source: Source) -> Iterator[ExtractedChunk]:
+        """Un fragment par section (le texte avant le premier titre forme le premier)."""
+        doc = DocxDocument(open_source(source))
+        title = doc.core_properties.title or None
+        for i, (heading, paragraphs) in enumerate(_iter_blocks(doc)):
+            yield ExtractedChunk(
+                index=i + 1,
+                title=heading,
+                text="\n\n".join(paragraphs),
+                document_title=title,
+            )
+            title = None
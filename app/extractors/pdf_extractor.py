@@ -1,28 +1,45 @@
 """Extracteur pour fichiers PDF."""
-from pathlib import Path
+from typing import Iterator
 from pypdf import PdfReader
-from app.models import ExtractedContent
-from .base import BaseExtractor
+from app.models import ExtractedChunk, ExtractedContent
+from .base import BaseExtractor, Source, open_source
+
+
+def _metadata_title(reader: PdfReader) -> str | None:
+    metadata = reader.metadata or {}
+    title = metadata.get("/Title") or metadata.get("/Subject") or None
+    if title is not None:
+        if isinstance(title, bytes):
+            title = title.decode("utf-8", errors="ignore")
+        title = (title or "").strip() or None
+    return title
+
+
+def _page_texts(reader: PdfReader) -> Iterator[tuple[int, str]]:
+    """(numéro de page, texte) pour chaque page non vide."""
+    for i, page in enumerate(reader.pages):
+        text = page.extract_text()
+        if text:
+            yield i + 1, text
 
 
 class PDFExtractor(BaseExtractor):
     """Extrait le texte des fichiers PDF."""
-    
+
     @property
     def supported_extensions(self) -> list[str]:
         return [".pdf"]
-    
-    def extract(self, path: Path) -> ExtractedContent:
-        reader = PdfReader(str(path))
-        text_parts = []
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                text_parts.append(text)
-        raw_text = "\n\n".join(text_parts).strip()
-        title = reader.metadata.get("/Title") or reader.metadata.get("/Subject") or None
-        if title is not None:
-            if isinstance(title, bytes):
-                title = title.decode("utf-8", errors="ignore")
-            title = (title or "").strip() or None
+
+    def extract(self, source: Source) -> ExtractedContent:
+        reader = PdfReader(open_source(source))
+        raw_text = "\n\n".join(text for _, text in _page_texts(reader)).strip()
+        title = _metadata_title(reader)
         return ExtractedContent(raw_text=raw_text, title=title, sections=[])
+
+    def iter_chunks(self, source: Source) -> Iterator[ExtractedChunk]:
+        """Une page à la fois : le texte n'est extrait qu'à la demande."""
+        reader = PdfReader(open_source(source))
+        title = _metadata_title(reader)
+        for number, text in _page_texts(reader):
+            yield ExtractedChunk(index=number, kind="page", text=text, document_title=title)
+            title = None
@@ -1,23 +1,222 @@
 """Extracteur pour fichiers PowerPoint (.pptx)."""
-from pathlib import Path
-from pptx import Presentation
-from pptx.util import Inches
-from app.models import ExtractedContent
-from .base import BaseExtractor
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Iterator
+from app.models import ExtractedChunk, ExtractedContent
+from .base import BaseExtractor, Source, open_source
+
+
+# Espaces de noms OOXML utilisés dans les parties de diapositives
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+    "dc": "http://purl.org/dc/elements/1.1/",
+}
+REL_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+REL_NOTES = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide"
+TITLE_PLACEHOLDERS = {"title", "ctrTitle"}
+
+
+def _rels_path(part: str) -> str:
+    folder, name = posixpath.split(part)
+    return posixpath.join(folder, "_rels", f"{name}.rels")
+
+
+def _read_rels(zf: zipfile.ZipFile, part: str) -> list[tuple[str, str, str]]:
+    """Retourne (id, type, cible absolue) pour chaque relation d'une partie."""
+    try:
+        root = ET.fromstring(zf.read(_rels_path(part)))
+    except KeyError:
+        return []
+    folder = posixpath.dirname(part)
+    rels = []
+    for rel in root.findall("rel:Relationship", NS):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = posixpath.normpath(posixpath.join(folder, rel.get("Target", "")))
+        rels.append((rel.get("Id", ""), rel.get("Type", ""), target))
+    return rels
+
+
+def _paragraphs(element: ET.Element) -> list[str]:
+    """Texte de chaque paragraphe (a:p) sous l'élément."""
+    texts = []
+    for para in element.iter(f"{{{NS['a']}}}p"):
+        text = "".join(t.text or "" for t in para.iter(f"{{{NS['a']}}}t")).strip()
+        if text:
+            texts.append(text)
+    return texts
+
+
+def _table_text(tbl: ET.Element) -> list[str]:
+    """Une ligne par rangée de tableau, cellules séparées par « | »."""
+    rows = []
+    for tr in tbl.findall("a:tr", NS):
+        cells = [" ".join(_paragraphs(tc)) for tc in tr.findall("a:tc", NS)]
+        if any(cells):
+            rows.append(" | ".join(cells))
+    return rows
+
+
+def _is_title(sp: ET.Element) -> bool:
+    ph = sp.find("p:nvSpPr/p:nvPr/p:ph", NS)
+    return ph is not None and ph.get("type") in TITLE_PLACEHOLDERS
+
+
+def _walk_shapes(tree: ET.Element, texts: list[str]) -> str | None:
+    """Parcourt l'arbre de formes (groupes inclus) et retourne le titre éventuel."""
+    title = None
+    for shape in tree:
+        tag = shape.tag.rsplit("}", 1)[-1]
+        if tag == "sp":
+            body = shape.find("p:txBody", NS)
+            if body is None:
+                continue
+            paras = _paragraphs(body)
+            if paras and title is None and _is_title(shape):
+                title = " ".join(paras)
+            texts.extend(paras)
+        elif tag == "grpSp":
+            group_title = _walk_shapes(shape, texts)
+            title = title or group_title
+        elif tag == "graphicFrame":
+            for tbl in shape.iter(f"{{{NS['a']}}}tbl"):
+                texts.extend(_table_text(tbl))
+    return title
+
+
+def _notes_text(zf: zipfile.ZipFile, notes_part: str) -> list[str]:
+    """Texte des notes de l'orateur (hors numéro de diapositive)."""
+    root = ET.fromstring(zf.read(notes_part))
+    texts = []
+    for sp in root.iter(f"{{{NS['p']}}}sp"):
+        ph = sp.find("p:nvSpPr/p:nvPr/p:ph", NS)
+        if ph is not None and ph.get("type") != "body":
+            continue
+        body = sp.find("p:txBody", NS)
+        if body is not None:
+            texts.extend(_paragraphs(body))
+    return texts
+
+
+def _parse_slide(zf: zipfile.ZipFile, part: str) -> tuple[str | None, list[str]]:
+    """Extrait (titre, textes) d'une diapositive directement depuis son XML."""
+    root = ET.fromstring(zf.read(part))
+    texts: list[str] = []
+    title = None
+    tree = root.find("p:cSld/p:spTree", NS)
+    if tree is not None:
+        title = _walk_shapes(tree, texts)
+    for _, rel_type, target in _read_rels(zf, part):
+        if rel_type == REL_NOTES and target in zf.NameToInfo:
+            texts.extend(_notes_text(zf, target))
+    return title, texts
+
+
+def _slide_parts(zf: zipfile.ZipFile) -> list[str]:
+    """Parties XML des diapositives, dans l'ordre de la présentation."""
+    presentation = "ppt/presentation.xml"
+    root = ET.fromstring(zf.read(presentation))
+    targets = {rid: target for rid, rel_type, target in _read_rels(zf, presentation) if rel_type == REL_SLIDE}
+    return [
+        targets[sld.get(f"{{{NS['r']}}}id")]
+        for sld in root.findall("p:sldIdLst/p:sldId", NS)
+        if sld.get(f"{{{NS['r']}}}id") in targets
+    ]
+
+
+def _package_title(zf: zipfile.ZipFile) -> str | None:
+    if "docProps/core.xml" not in zf.NameToInfo:
+        return None
+    core_title = ET.fromstring(zf.read("docProps/core.xml")).find("dc:title", NS)
+    if core_title is None or not core_title.text:
+        return None
+    return core_title.text.strip() or None
+
+
+def _iter_slides(zf: zipfile.ZipFile, slide_parts: list[str]) -> Iterator[tuple[str | None, list[str]]]:
+    """Parse les diapositives une à une, dans l'ordre, au rythme du consommateur.
+
+    Pas de threads : le parsing ElementTree garde le GIL et n'y gagnerait presque rien.
+    """
+    for part in slide_parts:
+        yield _parse_slide(zf, part)
 
 
 class PptxExtractor(BaseExtractor):
     """Extrait le texte des diapositives PowerPoint."""
-    
+
     @property
     def supported_extensions(self) -> list[str]:
         return [".pptx", ".ppt"]
-    
-    def extract(self, path: Path) -> ExtractedContent:
-        prs = Presentation(str(path))
+
+    def extract(self, source: Source) -> ExtractedContent:
+        try:
+            with zipfile.ZipFile(open_source(source)) as zf:
+                return self._extract_from_package(zf)
+        except (zipfile.BadZipFile, KeyError, ET.ParseError):
+            # Paquet atypique : on retombe sur python-pptx
+            return self._extract_with_python_pptx(source)
+
+    def iter_chunks(self, source: Source) -> Iterator[ExtractedChunk]:
+        """Une diapositive à la fois, dans l'ordre de la présentation."""
+        try:
+            zf = zipfile.ZipFile(open_source(source))
+            try:
+                slide_parts = _slide_parts(zf)
+            except BaseException:
+                zf.close()
+                raise
+        except (zipfile.BadZipFile, KeyError, ET.ParseError):
+            content = self._extract_with_python_pptx(source)
+            for i, section in enumerate(content.sections):
+                yield ExtractedChunk(
+                    index=i + 1,
+                    kind="slide",
+                    title=section["title"],
+                    text=section["content"][0],
+                    document_title=content.title if i == 0 else None,
+                )
+            return
+
+        with zf:
+            title = _package_title(zf) or f"Présentation ({len(slide_parts)} slides)"
+            for i, (slide_title, slide_texts) in enumerate(_iter_slides(zf, slide_parts)):
+                if slide_texts:
+                    yield ExtractedChunk(
+                        index=i + 1,
+                        kind="slide",
+                        title=slide_title or f"Slide {i + 1}",
+                        text="\n".join(slide_texts),
+                        document_title=title,
+                    )
+                    title = None
+
+    def _extract_from_package(self, zf: zipfile.ZipFile) -> ExtractedContent:
+        """Lecture rapide : parse le XML des diapositives sans charger tout le modèle objet."""
+        slide_parts = _slide_parts(zf)
         sections = []
         text_parts = []
-        
+        for i, (slide_title, slide_texts) in enumerate(_iter_slides(zf, slide_parts)):
+            if slide_texts:
+                slide_content = "\n".join(slide_texts)
+                sections.append({"title": slide_title or f"Slide {i + 1}", "content": [slide_content]})
+                text_parts.append(slide_content)
+
+        title = _package_title(zf) or f"Présentation ({len(slide_parts)} slides)"
+        raw_text = "\n\n---\n\n".join(text_parts)
+        return ExtractedContent(raw_text=raw_text, title=title, sections=sections)
+
+    def _extract_with_python_pptx(self, source: Source) -> ExtractedContent:
+        from pptx import Presentation
+
+        prs = Presentation(open_source(source))
+        sections = []
+        text_parts = []
+
         for i, slide in enumerate(prs.slides):
             slide_texts = []
             for shape in slide.shapes:
@@ -27,7 +226,7 @@ class PptxExtractor(BaseExtractor):
                 slide_content = "\n".join(slide_texts)
                 sections.append({"title": f"Slide {i + 1}", "content": [slide_content]})
                 text_parts.append(slide_content)
-        
+
         title = prs.core_properties.title or (f"Présentation ({len(prs.slides)} slides)")
         raw_text = "\n\n---\n\n".join(text_parts)
         return ExtractedContent(raw_text=raw_text, title=title, sections=sections)
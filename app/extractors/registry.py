@@ -1,32 +1,131 @@
-"""Registre des extracteurs et fonction d'extraction unifiée."""
+"""Registre des extracteurs et fonction d'extraction unifiée.
+
+Les extracteurs sont déclarés par extension sous forme ``"module:Classe"`` :
+le module (et sa bibliothèque : pypdf, python-docx…) n'est importé qu'au
+premier document de ce format. Des paquets tiers peuvent ajouter ou remplacer
+un extracteur via le point d'entrée ``infographic.extractors`` (nom =
+extension, valeur = ``"module:Classe"``), par exemple dans leur pyproject :
+
+    [project.entry-points."infographic.extractors"]
+    ".odt" = "mon_paquet.odt:OdtExtractor"
+"""
+import importlib
+import threading
+from importlib.metadata import entry_points
 from pathlib import Path
-from app.models import ExtractedContent
-from .base import BaseExtractor
-from .pdf_extractor import PDFExtractor
-from .docx_extractor import DocxExtractor
-from .pptx_extractor import PptxExtractor
-from .text_extractor import TextExtractor
+from typing import Iterator, Union
+from app.models import ExtractedChunk, ExtractedContent
+from .base import BaseExtractor, Source
+
+
+ENTRY_POINT_GROUP = "infographic.extractors"
+
+_TEXT = "app.extractors.text_extractor:TextExtractor"
+BUILTIN_EXTRACTORS: dict[str, str] = {
+    ".pdf": "app.extractors.pdf_extractor:PDFExtractor",
+    ".docx": "app.extractors.docx_extractor:DocxExtractor",
+    ".doc": "app.extractors.docx_extractor:DocxExtractor",
+    ".pptx": "app.extractors.pptx_extractor:PptxExtractor",
+    ".ppt": "app.extractors.pptx_extractor:PptxExtractor",
+    ".txt": _TEXT,
+    ".md": _TEXT,
+    ".rst": _TEXT,
+    ".log": _TEXT,
+    "": _TEXT,
+}
+
+# Cible d'un enregistrement : chemin "module:Classe", classe ou instance déjà créée
+ExtractorSpec = Union[str, type, BaseExtractor]
+
+_specs: dict[str, ExtractorSpec] | None = None
+# Une instance par cible, partagée entre les extensions qu'elle couvre
+_instances: dict[str, BaseExtractor] = {}
+_lock = threading.Lock()
+
+
+def _normalize(extension: str) -> str:
+    extension = extension.strip().lower()
+    return extension if not extension or extension.startswith(".") else f".{extension}"
+
+
+def _load_specs() -> dict[str, ExtractorSpec]:
+    """Extensions intégrées, complétées (ou remplacées) par les points d'entrée installés."""
+    global _specs
+    if _specs is None:
+        specs: dict[str, ExtractorSpec] = dict(BUILTIN_EXTRACTORS)
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            specs[_normalize(entry_point.name)] = entry_point.value
+        _specs = specs
+    return _specs
+
+
+def register_extractor(extension: str, extractor: ExtractorSpec) -> None:
+    """Associe une extension à un extracteur (``"module:Classe"``, classe ou instance)."""
+    with _lock:
+        _load_specs()[_normalize(extension)] = extractor
+
+
+def supported_extensions() -> list[str]:
+    """Extensions connues, sans importer les extracteurs."""
+    return sorted(ext for ext in _load_specs() if ext)
 
 
-_EXTRACTORS: list[BaseExtractor] = [
-    PDFExtractor(),
-    DocxExtractor(),
-    PptxExtractor(),
-    TextExtractor(),
-]
+def _instantiate(spec: ExtractorSpec) -> BaseExtractor:
+    if isinstance(spec, BaseExtractor):
+        return spec
+    if isinstance(spec, str):
+        module_name, _, attr = spec.partition(":")
+        spec = getattr(importlib.import_module(module_name), attr)
+    return spec()
+
+
+def _extractor_for(extension: str) -> BaseExtractor | None:
+    spec = _load_specs().get(extension)
+    if spec is None:
+        return None
+    # Clé de cache : la cible elle-même (une instance pour .txt, .md, .rst…)
+    key = spec if isinstance(spec, str) else f"{extension}:{id(spec)}"
+    extractor = _instances.get(key)
+    if extractor is None:
+        with _lock:
+            extractor = _instances.get(key)
+            if extractor is None:
+                extractor = _instances[key] = _instantiate(spec)
+    return extractor
 
 
 def get_extractor(path: Path) -> BaseExtractor | None:
     """Retourne l'extracteur approprié pour le fichier."""
-    for ext in _EXTRACTORS:
-        if ext.can_handle(path):
-            return ext
+    extractor = _extractor_for(path.suffix.lower())
+    if extractor is not None and extractor.can_handle(path):
+        return extractor
     return None
 
 
-def extract_from_file(path: Path) -> ExtractedContent:
-    """Extrait le contenu d'un fichier avec l'extracteur adapté."""
+def _require_extractor(path: Path) -> BaseExtractor:
     ext = get_extractor(path)
     if ext is None:
         raise ValueError(f"Format non supporté: {path.suffix}. Utilisez PDF, DOCX, PPTX ou TXT.")
-    return ext.extract(path)
+    return ext
+
+
+def extract_from_file(path: Path) -> ExtractedContent:
+    """Extrait le contenu d'un fichier avec l'extracteur adapté."""
+    return _require_extractor(path).extract(path)
+
+
+def extract_from_buffer(data: Source, filename: str) -> ExtractedContent:
+    """Extrait le contenu d'octets ou d'un objet fichier, sans passer par le disque.
+
+    ``filename`` ne sert qu'à choisir l'extracteur d'après son extension.
+    """
+    return _require_extractor(Path(filename)).extract(data)
+
+
+def iter_extract(data: Source, filename: str) -> Iterator[ExtractedChunk]:
+    """Extrait le document fragment par fragment (pages, diapositives ou sections).
+
+    Le format est vérifié immédiatement ; le parsing n'avance qu'au rythme
+    où le consommateur lit les fragments.
+    """
+    return _require_extractor(Path(filename)).iter_chunks(data)
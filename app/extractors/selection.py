@@ -0,0 +1,75 @@
+"""Sélection d'une partie du document : plages de pages et nombre maximal de caractères."""
+from typing import Iterable, Iterator
+from app.models import ExtractedChunk
+
+
+# Séparateur entre fragments dans le texte assemblé
+SEPARATOR = "\n\n"
+
+
+def parse_page_ranges(spec: str | None) -> list[tuple[int, int | None]] | None:
+    """Plages « 1-5,8,10- » (pages, diapositives ou sections, à partir de 1).
+
+    Une plage ouverte (``10-``) va jusqu'à la fin ; lève ``ValueError`` si
+    la syntaxe est invalide.
+    """
+    if spec is None or not spec.strip():
+        return None
+    ranges: list[tuple[int, int | None]] = []
+    for part in spec.split(","):
+        first, sep, last = part.strip().partition("-")
+        try:
+            start = int(first)
+            end = (int(last) if last.strip() else None) if sep else start
+        except ValueError:
+            raise ValueError(f"Plage de pages invalide: {part.strip()!r}") from None
+        if start < 1 or (end is not None and end < start):
+            raise ValueError(f"Plage de pages invalide: {part.strip()!r}")
+        ranges.append((start, end))
+    return ranges
+
+
+class ChunkSelector:
+    """Ne laisse passer que les fragments demandés, et au plus ``max_chars`` caractères.
+
+    Le flux source n'est plus lu dès que la sélection est complète : après la
+    dernière page demandée ou une fois ``max_chars`` atteint, l'extraction
+    s'arrête. ``chars`` compte les caractères du texte assemblé (séparateurs
+    compris) ; ``truncated`` indique que ``max_chars`` a coupé le texte.
+    """
+
+    def __init__(self, pages: list[tuple[int, int | None]] | None = None, max_chars: int | None = None):
+        self.pages = pages
+        self.max_chars = max_chars
+        self.last_page = None
+        if pages is not None and all(end is not None for _, end in pages):
+            self.last_page = max(end for _, end in pages)
+        self.count = 0
+        self.chars = 0
+        self.truncated = False
+
+    def _wanted(self, index: int) -> bool:
+        return self.pages is None or any(
+            start <= index and (end is None or index <= end) for start, end in self.pages
+        )
+
+    def select(self, chunks: Iterable[ExtractedChunk]) -> Iterator[ExtractedChunk]:
+        for chunk in chunks:
+            if self.last_page is not None and chunk.index > self.last_page:
+                break
+            if not chunk.text or not self._wanted(chunk.index):
+                continue
+            separator = len(SEPARATOR) if self.count else 0
+            if self.max_chars is not None:
+                room = self.max_chars - self.chars - separator
+                if room <= 0:
+                    self.truncated = True
+                    break
+                if len(chunk.text) > room:
+                    chunk = chunk.model_copy(update={"text": chunk.text[:room]})
+                    self.truncated = True
+            self.count += 1
+            self.chars += separator + len(chunk.text)
+            yield chunk
+            if self.truncated:
+                break
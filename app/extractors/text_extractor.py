@@ -1,45 +1,164 @@
 """Extracteur pour fichiers texte."""
+import codecs
+import logging
 from pathlib import Path
-from app.models import ExtractedContent
-from .base import BaseExtractor
+from typing import BinaryIO, Iterator
+from app.models import ExtractedChunk, ExtractedContent
+from .base import BaseExtractor, Source, open_source
+
+
+SAMPLE_SIZE = 64 * 1024
+CHUNK_SIZE = 1024 * 1024
+# Bornes mémoire : au-delà, le texte est lu mais n'est plus conservé
+MAX_LINE_CHARS = 100_000
+MAX_SECTION_CHARS = 20_000
+MAX_SECTIONS = 1_000
+MAX_RAW_CHARS = 5_000_000
+# Une section démesurée (ou un texte sans titres) est émise par morceaux de cette taille
+MAX_BLOCK_CHARS = 1_000_000
+
+logger = logging.getLogger(__name__)
+
+
+def _detect_encoding(sample: bytes) -> str:
+    """Devine l'encodage une seule fois, à partir du début du fichier."""
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    try:
+        sample.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # Seul un caractère multi-octets coupé par la fin d'un échantillon partiel est toléré
+        cut = len(sample) == SAMPLE_SIZE and e.reason == "unexpected end of data"
+        if not cut:
+            return "cp1252"
+    return "utf-8"
+
+
+def _iter_lines(stream: BinaryIO) -> Iterator[str]:
+    """Décode le flux par blocs et produit les lignes (sans le « \\n » final)."""
+    sample = stream.read(SAMPLE_SIZE)
+    decoder = codecs.getincrementaldecoder(_detect_encoding(sample))(errors="replace")
+    pending = ""
+    chunk = sample
+    while chunk:
+        pending += decoder.decode(chunk)
+        lines = pending.split("\n")
+        pending = lines.pop()
+        yield from lines
+        # Ligne démesurée (fichier sans retours à la ligne) : on la coupe
+        while len(pending) > MAX_LINE_CHARS:
+            yield pending[:MAX_LINE_CHARS]
+            pending = pending[MAX_LINE_CHARS:]
+        chunk = stream.read(CHUNK_SIZE)
+    pending += decoder.decode(b"", final=True)
+    yield from pending.split("\n")
 
 
 class TextExtractor(BaseExtractor):
-    """Extrait le contenu des fichiers texte."""
-    
+    """Extrait le contenu des fichiers texte, en flux et à mémoire bornée."""
+
     @property
     def supported_extensions(self) -> list[str]:
         return [".txt", ".md", ".rst", ".log", ""]
-    
+
     def can_handle(self, path: Path) -> bool:
         ext = path.suffix.lower()
         return ext in self.supported_extensions or (ext == "" and path.is_file())
-    
-    def extract(self, path: Path) -> ExtractedContent:
-        try:
-            raw = path.read_text(encoding="utf-8", errors="replace")
-        except Exception:
-            raw = path.read_text(encoding="latin-1", errors="replace")
-        
-        lines = raw.strip().split("\n")
+
+    def extract(self, source: Source) -> ExtractedContent:
+        raw_parts: list[str] = []
         sections = []
+        title = None
+        raw_size = 0
+        truncated = False
+        for block_title, content, raw_block, first_line, continued in self._iter_source(source):
+            title = title if title is not None else first_line
+            if raw_size < MAX_RAW_CHARS:
+                raw_parts.append(raw_block)
+                raw_size += len(raw_block) + 1
+            else:
+                truncated = truncated or bool(raw_block.strip())
+            if block_title is not None and content and not continued and len(sections) < MAX_SECTIONS:
+                sections.append({"title": block_title, "content": content})
+
+        raw_text = "\n".join(raw_parts).strip()
+        truncated = truncated or len(raw_text) > MAX_RAW_CHARS
+        if truncated:
+            logger.warning("Texte brut tronqué à %d caractères.", MAX_RAW_CHARS)
+        return ExtractedContent(raw_text=raw_text[:MAX_RAW_CHARS], title=title, sections=sections, truncated=truncated)
+
+    def iter_chunks(self, source: Source) -> Iterator[ExtractedChunk]:
+        """Un fragment par section, émis dès que la section suivante commence.
+
+        Rien n'est tronqué : une section démesurée donne plusieurs fragments
+        d'au plus ``MAX_BLOCK_CHARS`` caractères.
+        """
+        index = 0
+        title_sent = False
+        for block_title, content, raw_block, first_line, continued in self._iter_source(source):
+            if not content and not (continued and raw_block.strip()):
+                continue
+            index += 1
+            yield ExtractedChunk(
+                index=index,
+                title=block_title,
+                text=raw_block.strip(),
+                document_title=None if title_sent else first_line,
+            )
+            title_sent = title_sent or first_line is not None
+
+    def _iter_source(self, source: Source) -> Iterator[tuple[str | None, list[str], str, str | None, bool]]:
+        if isinstance(source, Path):
+            with source.open("rb") as stream:
+                yield from self._iter_blocks(stream)
+        else:
+            yield from self._iter_blocks(open_source(source))
+
+    def _iter_blocks(self, stream: BinaryIO) -> Iterator[tuple[str | None, list[str], str, str | None, bool]]:
+        """Découpe le flux en blocs (titre, contenu retenu, texte brut, titre du document, suite).
+
+        Le titre du document (première ligne utile) n'est renseigné que sur le
+        premier bloc qui le contient. Un bloc qui atteint ``MAX_BLOCK_CHARS`` est
+        émis tel quel ; la suite de la même section est marquée ``suite=True``.
+        """
+        first_line = None
         current_title = None
-        current_content = []
-        
-        for line in lines:
+        current_content: list[str] = []
+        current_raw: list[str] = []
+        current_size = 0
+        block_size = 0
+        continued = False
+
+        for line in _iter_lines(stream):
             stripped = line.strip()
-            if not stripped:
-                continue
-            if line.startswith("#") or (len(stripped) < 80 and stripped.endswith(":") and not current_title):
-                if current_title is not None and current_content:
-                    sections.append({"title": current_title, "content": current_content})
+            is_first = False
+            if stripped and first_line is None:
+                # Première ligne utile : équivalent de raw.strip().split("\n")[0]
+                first_line = stripped.lstrip("#").strip()
+                line = line.lstrip()
+                is_first = True
+            if stripped and (line.startswith("#") or (len(stripped) < 80 and stripped.endswith(":") and not current_title)):
+                if current_raw:
+                    yield current_title, current_content, "\n".join(current_raw), None if is_first else first_line, continued
                 current_title = stripped.lstrip("#").strip().rstrip(":")
                 current_content = []
-            else:
+                current_raw = []
+                current_size = 0
+                block_size = 0
+                continued = False
+            elif stripped and current_size < MAX_SECTION_CHARS:
                 current_content.append(stripped)
-        
-        if current_title is not None and current_content:
-            sections.append({"title": current_title, "content": current_content})
-        
-        title = lines[0].strip().lstrip("#").strip() if lines else None
-        return ExtractedContent(raw_text=raw.strip(), title=title, sections=sections)
+                current_size += len(stripped)
+            current_raw.append(line)
+            block_size += len(line) + 1
+            if block_size >= MAX_BLOCK_CHARS:
+                yield current_title, current_content, "\n".join(current_raw), first_line, continued
+                current_content = []
+                current_raw = []
+                block_size = 0
+                continued = True
+
+        if current_raw or current_title is not None:
+            yield current_title, current_content, "\n".join(current_raw), first_line, continued
@@ -1,4 +1,12 @@
 """Génération d'infographies à partir de l'analyse."""
-from .infographic_generator import generate_infographic_html
+from .infographic_generator import DEFAULT_TEMPLATE, generate_infographic_html, list_templates
+from .assets import CACHE_CONTROL, get_asset, inline_stylesheets
 
-__all__ = ["generate_infographic_html"]
+__all__ = [
+    "DEFAULT_TEMPLATE",
+    "generate_infographic_html",
+    "list_templates",
+    "CACHE_CONTROL",
+    "get_asset",
+    "inline_stylesheets",
+]
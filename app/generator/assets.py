@@ -0,0 +1,200 @@
+"""Feuilles de style des infographies : une feuille commune et une par thème, nommées par empreinte.
+
+Le contenu est identique pour toutes les infographies d'un même thème : les
+fichiers sont servis sous ``/assets/`` avec un cache navigateur permanent,
+leur nom changeant dès que leur contenu change.
+
+Chaque version construite est aussi écrite dans le stockage ``output`` (sous
+``assets/``) et n'en est jamais retirée : les pages générées avant un
+changement de style ou un déploiement gardent des liens valides, quel que
+soit le worker ou le nœud qui les sert. Cette écriture est suspendue dans le
+maître gunicorn (``enable_persistence(False)``) : chaque worker la fait
+après le fork, avec son propre client de stockage.
+
+Construction hors ligne : ``python -m app.generator.assets [dossier]``.
+"""
+import hashlib
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from jinja2 import Environment, FileSystemLoader
+from app.design.theme import THEMES, Theme
+
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+ASSETS_URL_PREFIX = "/assets/"
+ASSETS_KEY_PREFIX = "assets/"
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Les noms présents dans le stockage sont relus au plus une fois par LISTING_TTL
+# secondes : un nom inconnu donne un 404 sans autre accès au stockage
+LISTING_TTL = 10.0
+
+# Pas d'échappement HTML : les polices contiennent des apostrophes
+_env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)))
+
+PATTERN_ASSET_NAME = re.compile(r"[\w-]+\.[0-9a-f]{12}\.css")
+PATTERN_STYLESHEET_LINK = re.compile(
+    r'<link rel="stylesheet" href="' + re.escape(ASSETS_URL_PREFIX) + r'([\w.-]+\.css)">'
+)
+
+# Nom de fichier -> contenu, pour tout ce qui a déjà été construit
+_assets: dict[str, str] = {}
+_base: tuple[str, str] | None = None
+_themes: dict[str, tuple[str, str]] = {}
+# Noms déjà présents dans le stockage partagé
+_persisted: set[str] = set()
+_built = False
+_persistence = True
+_listing: set[str] = set()
+_listed_at: float | None = None
+
+
+@dataclass(frozen=True)
+class Stylesheets:
+    """Feuilles de style d'une infographie (contenu et nom versionné)."""
+    base_name: str
+    base_css: str
+    theme_name: str
+    theme_css: str
+
+    @property
+    def base_url(self) -> str:
+        return ASSETS_URL_PREFIX + self.base_name
+
+    @property
+    def theme_url(self) -> str:
+        return ASSETS_URL_PREFIX + self.theme_name
+
+
+def _register(stem: str, css: str) -> tuple[str, str]:
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    name = f"{stem}.{digest}.css"
+    _assets[name] = css
+    return name, css
+
+
+def _base_stylesheet() -> tuple[str, str]:
+    global _base
+    if _base is None:
+        _base = _register("infographic", (TEMPLATES_DIR / "infographic.css").read_text(encoding="utf-8"))
+    return _base
+
+
+def _theme_stylesheet(theme: Theme) -> tuple[str, str]:
+    # Le repr du dataclass couvre tous les champs : un thème modifié change de clé
+    key = repr(theme)
+    if key not in _themes:
+        slug = "-".join(theme.name.lower().split())
+        css = _env.get_template("theme.css").render(theme=theme)
+        _themes[key] = _register(f"theme-{slug}", css)
+    return _themes[key]
+
+
+def get_stylesheets(theme: Theme) -> Stylesheets:
+    base_name, base_css = _base_stylesheet()
+    theme_name, theme_css = _theme_stylesheet(theme)
+    if _persistence and (base_name not in _persisted or theme_name not in _persisted):
+        persist_assets()
+    return Stylesheets(base_name, base_css, theme_name, theme_css)
+
+
+def build_assets() -> dict[str, str]:
+    """Construit la feuille commune et celles de tous les thèmes connus."""
+    global _built
+    for theme in THEMES:
+        get_stylesheets(theme)
+    _built = True
+    return dict(_assets)
+
+
+def enable_persistence(enabled: bool) -> None:
+    """Active ou suspend l'écriture des feuilles construites dans le stockage."""
+    global _persistence
+    _persistence = enabled
+
+
+def persist_assets() -> list[str]:
+    """Écrit dans le stockage ``output`` les feuilles construites qui n'y sont pas encore.
+
+    Une erreur de stockage n'empêche pas le rendu : la feuille reste servie
+    par ce processus et sera réécrite à la prochaine tentative.
+    """
+    from app.storage import get_storage
+    written = []
+    try:
+        storage = get_storage("output")
+        for name, css in list(_assets.items()):
+            if name in _persisted:
+                continue
+            key = ASSETS_KEY_PREFIX + name
+            if storage.stat(key) is None:
+                storage.write_text(key, css)
+                written.append(name)
+            _persisted.add(name)
+    except Exception as e:
+        print(f"Erreur lors de l'enregistrement des feuilles de style: {e}")
+    return written
+
+
+def _persisted_names() -> set[str]:
+    """Noms des feuilles du stockage ``output``, relus au plus une fois par LISTING_TTL."""
+    global _listing, _listed_at
+    now = time.monotonic()
+    if _listed_at is None or now - _listed_at >= LISTING_TTL:
+        _listed_at = now
+        from app.storage import get_storage
+        try:
+            keys = get_storage("output").list(ASSETS_KEY_PREFIX)
+            _listing = {key[len(ASSETS_KEY_PREFIX):] for key in keys}
+        except Exception as e:
+            print(f"Erreur lors de la lecture des feuilles de style enregistrées: {e}")
+    return _listing
+
+
+def _load_persisted(name: str) -> str | None:
+    """Version antérieure (autre déploiement, autre worker) lue dans le stockage."""
+    if not PATTERN_ASSET_NAME.fullmatch(name) or name not in _persisted_names():
+        return None
+    from app.storage import get_storage
+    try:
+        css = get_storage("output").read_text(ASSETS_KEY_PREFIX + name)
+    except (FileNotFoundError, ValueError):
+        return None
+    _assets[name] = css
+    _persisted.add(name)
+    return css
+
+
+def get_asset(name: str) -> str | None:
+    """Contenu d'une feuille versionnée, ou None si le nom est inconnu."""
+    if name not in _assets and not _built:
+        build_assets()
+    css = _assets.get(name)
+    return css if css is not None else _load_persisted(name)
+
+
+def inline_stylesheets(html: str) -> str:
+    """Remplace les liens ``/assets/*.css`` d'une page déjà générée par leur contenu."""
+    def _inline(match: re.Match) -> str:
+        css = get_asset(match.group(1))
+        return match.group(0) if css is None else f"<style>\n{css}</style>"
+    return PATTERN_STYLESHEET_LINK.sub(_inline, html)
+
+
+def write_assets(directory: Path) -> list[Path]:
+    """Écrit toutes les feuilles dans ``directory`` (pour un CDN ou un reverse proxy)."""
+    directory.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, css in build_assets().items():
+        path = directory / name
+        path.write_text(css, encoding="utf-8")
+        written.append(path)
+    return written
+
+
+if __name__ == "__main__":
+    target = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("output") / "assets"
+    for path in write_assets(target):
+        print(path)
@@ -0,0 +1,121 @@
+"""Rendu des graphiques en SVG côté serveur (identique en HTML et en PDF)."""
+import math
+from functools import lru_cache
+from html import escape
+from app.design.theme import Theme
+
+
+WIDTH = 800
+HEIGHT = 400
+MARGIN_LEFT = 56
+MARGIN_RIGHT = 16
+MARGIN_TOP = 28
+MARGIN_BOTTOM = 64
+GRID_LINES = 5
+MAX_LABEL_CHARS = 18
+
+
+def parse_chart_value(value) -> float:
+    """Valeur d'une catégorie du graphique (« 1 234,5 », « 15% ») ; 0 si illisible ou non finie.
+
+    Partagée par le SVG et la vignette, pour que les deux tracent les mêmes barres.
+    """
+    try:
+        number = float(str(value).replace(",", ".").replace(" ", "").rstrip("%"))
+    except (ValueError, TypeError):
+        return 0.0
+    # « nan » ou « inf » fausseraient l'échelle des barres
+    return number if math.isfinite(number) else 0.0
+
+
+def _nice_step(max_value: float) -> float:
+    """Pas de graduation « rond » (1, 2, 5 × 10^n) couvrant max_value en GRID_LINES pas."""
+    raw = max_value / GRID_LINES
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if raw <= factor * magnitude:
+            return factor * magnitude
+    return 10 * magnitude
+
+
+def _format(value: float) -> str:
+    return f"{value:g}" if abs(value) < 1e6 else f"{value:.3g}"
+
+
+@lru_cache(maxsize=256)
+def _render_bar_chart(
+    labels: tuple[str, ...],
+    values: tuple[float, ...],
+    colors: tuple[str, ...],
+    text_color: str,
+    muted_color: str,
+    font_family: str,
+) -> str:
+    top = max(max(values, default=0.0), 0.0) or 1.0
+    step = _nice_step(top)
+    axis_max = step * math.ceil(top / step)
+    plot_w = WIDTH - MARGIN_LEFT - MARGIN_RIGHT
+    plot_h = HEIGHT - MARGIN_TOP - MARGIN_BOTTOM
+    slot = plot_w / len(values)
+    bar_w = min(48.0, slot * 0.6)
+    font = escape(font_family)
+
+    parts = [
+        f'<svg class="chart-svg" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {WIDTH} {HEIGHT}" '
+        f'width="100%" role="img" font-family="{font}">'
+    ]
+    # Grille horizontale et graduations
+    for i in range(GRID_LINES + 1):
+        tick = axis_max * i / GRID_LINES
+        y = MARGIN_TOP + plot_h - plot_h * i / GRID_LINES
+        parts.append(
+            f'<line x1="{MARGIN_LEFT}" y1="{y:.1f}" x2="{WIDTH - MARGIN_RIGHT}" y2="{y:.1f}" '
+            f'stroke="rgba(0,0,0,0.05)"/>'
+            f'<text x="{MARGIN_LEFT - 8}" y="{y + 4:.1f}" text-anchor="end" font-size="12" '
+            f'fill="{escape(muted_color)}">{_format(tick)}</text>'
+        )
+    # Barres, valeurs et libellés
+    for i, (label, value) in enumerate(zip(labels, values)):
+        height = plot_h * max(value, 0.0) / axis_max
+        x = MARGIN_LEFT + slot * i + (slot - bar_w) / 2
+        y = MARGIN_TOP + plot_h - height
+        color = escape(colors[i % len(colors)]) if colors else "#888888"
+        short = label if len(label) <= MAX_LABEL_CHARS else label[: MAX_LABEL_CHARS - 1] + "…"
+        center = x + bar_w / 2
+        parts.append(
+            f'<rect x="{x:.1f}" y="{y:.1f}" width="{bar_w:.1f}" height="{height:.1f}" rx="8" fill="{color}">'
+            f"<title>{escape(label)} : {_format(value)}</title></rect>"
+            f'<text x="{center:.1f}" y="{y - 6:.1f}" text-anchor="middle" font-size="12" font-weight="700" '
+            f'fill="{escape(text_color)}">{_format(value)}</text>'
+            f'<text x="{center:.1f}" y="{HEIGHT - MARGIN_BOTTOM + 20}" text-anchor="middle" font-size="12" '
+            f'font-weight="600" fill="{escape(text_color)}">{escape(short)}</text>'
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def render_bar_chart_svg(labels: list[str], values: list[float], theme: Theme) -> str:
+    """Diagramme en barres aux couleurs du thème, en SVG autonome.
+
+    Le rendu est mis en cache d'après les données et les champs du thème
+    utilisés : deux infographies aux mêmes chiffres partagent le même SVG.
+    Les valeurs non finies (NaN, infini) sont écartées avec leur libellé.
+    """
+    points = []
+    for label, value in zip(labels, values):
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            continue
+        if math.isfinite(number):
+            points.append((str(label), number))
+    if not points:
+        return ""
+    return _render_bar_chart(
+        tuple(label for label, _ in points),
+        tuple(value for _, value in points),
+        tuple(theme.chart_colors),
+        theme.text,
+        theme.text_light,
+        theme.font_body.replace("'", ""),
+    )
@@ -3,32 +3,47 @@ from pathlib import Path
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from app.models import DocumentAnalysis
 from app.design.theme import Theme, get_theme_for_analysis
+from .assets import get_stylesheets
+from .charts import parse_chart_value, render_bar_chart_svg
 
 
-def _safe_float(s: str) -> float:
-    try:
-        return float(str(s).replace(",", ".").replace(" ", ""))
-    except (ValueError, TypeError):
-        return 0.0
+DEFAULT_TEMPLATE = "infographic.html"
 
+# Environnement partagé : les templates compilés restent en cache entre deux rendus
+# (Jinja recharge automatiquement un template modifié sur disque)
+_env = Environment(
+    loader=FileSystemLoader(str(Path(__file__).parent / "templates")),
+    autoescape=select_autoescape(["html", "xml"]),
+)
 
-def generate_infographic_html(analysis: DocumentAnalysis, theme: Theme | None = None) -> str:
-    """Produit le HTML complet de l'infographie."""
+
+def list_templates() -> list[str]:
+    """Templates HTML d'infographie disponibles."""
+    return _env.list_templates(extensions=["html"])
+
+
+def generate_infographic_html(
+    analysis: DocumentAnalysis,
+    theme: Theme | None = None,
+    template_name: str = DEFAULT_TEMPLATE,
+    inline_assets: bool = False,
+) -> str:
+    """Produit le HTML complet de l'infographie.
+
+    Par défaut, les feuilles de style sont référencées (``/assets/...``) ;
+    ``inline_assets=True`` les intègre dans la page, pour un fichier autonome
+    (téléchargement, PDF).
+    """
     if theme is None:
         theme = get_theme_for_analysis(analysis)
     
     # Données pour graphiques
     chart_data = analysis.categories_for_chart or {}
     chart_labels = list(chart_data.keys())
-    chart_values = [_safe_float(v) for v in chart_data.values()]
+    chart_values = [parse_chart_value(v) for v in chart_data.values()]
     max_val = max(chart_values, default=1) or 1
     
-    templates_dir = Path(__file__).parent / "templates"
-    env = Environment(
-        loader=FileSystemLoader(str(templates_dir)),
-        autoescape=select_autoescape(["html", "xml"]),
-    )
-    template = env.get_template("infographic.html")
+    template = _env.get_template(template_name)
     
     return template.render(
         analysis=analysis,
@@ -37,4 +52,7 @@ def generate_infographic_html(analysis: DocumentAnalysis, theme: Theme | None =
         chart_values=chart_values,
         chart_max=max_val,
         chart_colors=theme.chart_colors,
+        chart_svg=render_bar_chart_svg(chart_labels, chart_values, theme),
+        stylesheets=get_stylesheets(theme),
+        inline_assets=inline_assets,
     )
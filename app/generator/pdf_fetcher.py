@@ -0,0 +1,147 @@
+"""Récupération des ressources (images, polices, CSS) pour WeasyPrint, sans dépendre du réseau.
+
+Les ressources locales (``/images/*``, ``/assets/*``, polices embarquées)
+sont servies depuis le disque ; les ressources distantes autorisées sont
+mises en cache en mémoire et sur disque ; les autres hôtes sont refusés
+immédiatement plutôt que d'attendre un délai réseau.
+"""
+import hashlib
+import json
+import mimetypes
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from app.config import Settings, get_settings
+from .assets import ASSETS_URL_PREFIX, get_asset
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+# Images servies sous /images (6.png, 7.png) : seuls ces fichiers du projet sont lisibles
+IMAGES_DIR = PROJECT_ROOT
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp"}
+# Polices embarquées : fonts.css (avec des url() relatives) et les fichiers de police
+FONTS_DIR = Path(__file__).resolve().parent.parent / "static" / "fonts"
+GOOGLE_FONTS_CSS_HOST = "fonts.googleapis.com"
+# Après un échec réseau, l'URL est refusée d'office pendant ce délai (secondes)
+FAILURE_BACKOFF = 300
+
+
+class BlockedResourceError(ValueError):
+    """Ressource hors liste blanche : WeasyPrint l'ignore sans attendre le réseau."""
+
+
+def _local_file(path: Path) -> dict:
+    mime_type, _ = mimetypes.guess_type(path.name)
+    return {
+        "string": path.read_bytes(),
+        "mime_type": mime_type or "application/octet-stream",
+        "redirected_url": path.as_uri(),
+    }
+
+
+class PdfUrlFetcher:
+    """``url_fetcher`` pour WeasyPrint, avec cache mémoire + disque à durée de vie."""
+
+    def __init__(self, settings: Settings):
+        self.allowed_hosts = {host.lower() for host in settings.pdf_allowed_hosts}
+        self.timeout = settings.pdf_fetch_timeout
+        self.ttl = settings.asset_cache_ttl
+        self.cache_dir = settings.asset_cache_dir / "pdf"
+        self._memory: dict[str, tuple[float, dict]] = {}
+        self._failures: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, url: str, timeout: int = 10, ssl_context=None) -> dict:
+        parts = urlsplit(url)
+        if parts.scheme == "data":
+            from weasyprint import default_url_fetcher
+            return default_url_fetcher(url, timeout=timeout, ssl_context=ssl_context)
+        if parts.scheme == "file":
+            return self._fetch_local(Path(unquote(parts.path)))
+        if parts.scheme in ("http", "https"):
+            host = (parts.hostname or "").lower()
+            if host == GOOGLE_FONTS_CSS_HOST and (FONTS_DIR / "fonts.css").is_file():
+                return _local_file(FONTS_DIR / "fonts.css")
+            if host in self.allowed_hosts:
+                return self._fetch_remote(url)
+        raise BlockedResourceError(f"Ressource non autorisée pour le PDF: {url}")
+
+    def _fetch_local(self, path: Path) -> dict:
+        """Chemins absolus du HTML (``/images/6.png``, ``/assets/x.css``) ou polices embarquées.
+
+        Hors feuilles versionnées, seules les images de IMAGES_DIR et les
+        fichiers de FONTS_DIR sont lus : jamais ``.env``, ``uploads/``, etc.
+        """
+        posix = path.as_posix()
+        if posix.startswith(ASSETS_URL_PREFIX):
+            css = get_asset(posix[len(ASSETS_URL_PREFIX):])
+            if css is not None:
+                return {"string": css.encode("utf-8"), "mime_type": "text/css", "encoding": "utf-8"}
+        if posix.startswith("/images/"):
+            path = IMAGES_DIR / posix[len("/images/"):]
+        resolved = path.resolve()
+        image = resolved.parent == IMAGES_DIR and resolved.suffix.lower() in IMAGE_SUFFIXES
+        if (image or resolved.is_relative_to(FONTS_DIR)) and resolved.is_file():
+            return _local_file(resolved)
+        raise BlockedResourceError(f"Fichier local introuvable ou non autorisé: {path}")
+
+    def _fetch_remote(self, url: str) -> dict:
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(url)
+        if cached and cached[0] > now:
+            return dict(cached[1])
+
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        meta_path = self.cache_dir / f"{key}.json"
+        body_path = self.cache_dir / f"{key}.bin"
+        stale = None
+        if meta_path.is_file() and body_path.is_file():
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            stale = {"string": body_path.read_bytes(), "mime_type": meta["mime_type"], "redirected_url": url}
+            if meta["expires"] > now:
+                self._remember(url, meta["expires"], stale)
+                return dict(stale)
+
+        if self._failures.get(url, 0) > now:
+            # Échec récent : on ne retente pas le réseau à chaque rendu
+            if stale is not None:
+                return dict(stale)
+            raise BlockedResourceError(f"Ressource injoignable récemment, ignorée: {url}")
+        try:
+            with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                body = response.read()
+                mime_type = response.headers.get_content_type()
+        except OSError:
+            with self._lock:
+                self._failures[url] = now + FAILURE_BACKOFF
+            if stale is not None:
+                # Réseau indisponible : une copie expirée vaut mieux qu'une ressource manquante
+                return dict(stale)
+            raise
+
+        expires = now + self.ttl
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(body)
+        meta_path.write_text(json.dumps({"url": url, "mime_type": mime_type, "expires": expires}), encoding="utf-8")
+        result = {"string": body, "mime_type": mime_type, "redirected_url": url}
+        self._remember(url, expires, result)
+        return dict(result)
+
+    def _remember(self, url: str, expires: float, result: dict) -> None:
+        with self._lock:
+            self._memory[url] = (expires, result)
+
+
+_fetcher: PdfUrlFetcher | None = None
+
+
+def get_pdf_url_fetcher() -> PdfUrlFetcher:
+    """Instance partagée, pour que le cache mémoire survive d'un rendu à l'autre."""
+    global _fetcher
+    if _fetcher is None:
+        _fetcher = PdfUrlFetcher(get_settings())
+    return _fetcher
@@ -0,0 +1,119 @@
+"""Vignettes PNG des infographies (aperçu pour les galeries), dessinées avec Pillow.
+
+La vignette reprend la mise en page de l'infographie — bandeau dégradé et
+titre, chiffres clés, diagramme en barres — à partir de la même analyse et
+du même thème, sans passer par un navigateur ni par le PDF.
+"""
+import io
+from PIL import Image, ImageDraw, ImageFont
+from app.design.theme import Theme
+from app.models import DocumentAnalysis
+from .charts import parse_chart_value
+
+
+THUMBNAIL_SIZE = (480, 320)
+FONT_CANDIDATES = {
+    True: ["DejaVuSans-Bold.ttf", "LiberationSans-Bold.ttf", "Arial Bold.ttf", "arialbd.ttf"],
+    False: ["DejaVuSans.ttf", "LiberationSans-Regular.ttf", "Arial.ttf", "arial.ttf"],
+}
+
+
+def _font(size: int, bold: bool = False) -> ImageFont.ImageFont:
+    for name in FONT_CANDIDATES[bold]:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size)
+
+
+def _rgb(color: str) -> tuple[int, int, int]:
+    color = color.lstrip("#")
+    if len(color) == 3:
+        color = "".join(c * 2 for c in color)
+    return int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+
+
+def _wrap(draw: ImageDraw.ImageDraw, text: str, font, width: int, max_lines: int) -> list[str]:
+    lines: list[str] = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}".strip()
+        if draw.textlength(candidate, font=font) <= width:
+            current = candidate
+            continue
+        if current:
+            lines.append(current)
+        current = word
+        if len(lines) == max_lines:
+            break
+    if current and len(lines) < max_lines:
+        lines.append(current)
+    if len(lines) == max_lines and " ".join(lines) != " ".join(text.split()):
+        lines[-1] = lines[-1].rstrip(".") + "…"
+    return lines
+
+
+def render_thumbnail(analysis: DocumentAnalysis, theme: Theme, size: tuple[int, int] = THUMBNAIL_SIZE) -> bytes:
+    """PNG de l'aperçu de l'infographie."""
+    width, height = size
+    image = Image.new("RGB", size, _rgb(theme.background))
+    draw = ImageDraw.Draw(image)
+
+    # Bandeau : dégradé horizontal comme le .hero de la page
+    hero_h = int(height * 0.42)
+    start, end = _rgb(theme.gradient_start), _rgb(theme.gradient_end)
+    for x in range(width):
+        t = x / max(width - 1, 1)
+        draw.line([(x, 0), (x, hero_h)], fill=tuple(round(a + (b - a) * t) for a, b in zip(start, end)))
+
+    margin = int(width * 0.05)
+    title_size = max(14, height // 12)
+    title_font = _font(title_size, bold=True)
+    lines = _wrap(draw, analysis.title or "Infographie", title_font, width - 2 * margin, 2)
+    line_h = title_size + 6
+    y = (hero_h - line_h * len(lines)) // 2
+    for line in lines:
+        draw.text((width // 2, y), line, font=title_font, fill="white", anchor="ma")
+        y += line_h
+
+    # Chiffres clés : trois cartes au plus
+    figures = analysis.key_figures[:3]
+    card_top = hero_h + margin // 2
+    card_h = int(height * 0.2)
+    if figures:
+        gap = margin // 2
+        card_w = (width - 2 * margin - gap * (len(figures) - 1)) // len(figures)
+        value_font = _font(max(12, height // 14), bold=True)
+        label_font = _font(max(9, height // 28))
+        for i, fig in enumerate(figures):
+            x0 = margin + i * (card_w + gap)
+            draw.rounded_rectangle([x0, card_top, x0 + card_w, card_top + card_h], radius=8, fill=_rgb(theme.card_bg))
+            draw.rectangle([x0, card_top, x0 + card_w, card_top + 3], fill=_rgb(theme.primary))
+            cx = x0 + card_w // 2
+            draw.text((cx, card_top + card_h * 0.22), str(fig.value)[:10], font=value_font, fill=_rgb(theme.primary), anchor="ma")
+            label = _wrap(draw, fig.label, label_font, card_w - 8, 1)
+            if label:
+                draw.text((cx, card_top + card_h * 0.66), label[0], font=label_font, fill=_rgb(theme.text_light), anchor="ma")
+
+    # Diagramme en barres (mêmes données et couleurs que le graphique SVG)
+    values = [parse_chart_value(v) for v in (analysis.categories_for_chart or {}).values()][:8]
+    chart_top = card_top + card_h + margin // 2
+    chart_bottom = height - margin // 2
+    if values and chart_bottom - chart_top > 10:
+        top = max(max(values), 0.0) or 1.0
+        slot = (width - 2 * margin) / len(values)
+        bar_w = max(4, min(int(slot * 0.6), width // 8))
+        colors = theme.chart_colors or [theme.primary]
+        for i, value in enumerate(values):
+            bar_h = (chart_bottom - chart_top) * max(value, 0.0) / top
+            x0 = margin + slot * i + (slot - bar_w) / 2
+            draw.rounded_rectangle(
+                [x0, chart_bottom - max(bar_h, 2), x0 + bar_w, chart_bottom],
+                radius=3,
+                fill=_rgb(colors[i % len(colors)]),
+            )
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
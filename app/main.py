@@ -1,17 +1,33 @@
 """Point d'entrée FastAPI — plateforme infographie intelligente."""
+import asyncio
+import json
 import uuid
 from pathlib import Path
-from fastapi import FastAPI, UploadFile, File, HTTPException, Body
-from fastapi.responses import HTMLResponse, FileResponse
+from anyio import from_thread
+from fastapi import FastAPI, UploadFile, File, HTTPException, Body, BackgroundTasks, Query, Request
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.admission import StageSlot, acquire_slot, admit, admitted
 from app.config import get_settings
-from app.extractors import extract_from_file
-from app.analyzer import analyze_content
-from app.generator import generate_infographic_html
-from app.design import get_theme_for_analysis
+from app.compression import compress_bytes, compress_stream, negotiate_encoding
+from app.extractors import ChunkSelector, iter_extract, parse_page_ranges, supported_extensions
+from app.analyzer import BoilerplateFilter, analyze_content_stream
+from app.generator import (
+    CACHE_CONTROL,
+    DEFAULT_TEMPLATE,
+    generate_infographic_html,
+    get_asset,
+    inline_stylesheets,
+    list_templates,
+)
+from app.generator.pdf_fetcher import get_pdf_url_fetcher
+from app.design import THEMES, Theme, get_theme_for_analysis, get_theme_by_name
 from app.models import DocumentAnalysis
+from app.storage import get_storage, storage_response
 
 
 app = FastAPI(
@@ -28,11 +44,10 @@ app.add_middleware(
 )
 
 
-def _ensure_dirs():
-    settings = get_settings()
-    settings.upload_dir.mkdir(parents=True, exist_ok=True)
-    settings.output_dir.mkdir(parents=True, exist_ok=True)
-
+# Vignette demandée avec la version courante de l'analyse (?v=) : l'URL change à chaque
+# re-rendu, le contenu peut être gardé définitivement. Sans version : revalidation par ETag.
+THUMBNAIL_CACHE_CONTROL = "public, max-age=31536000, immutable"
+THUMBNAIL_REVALIDATE = "no-cache"
 
 ALLOWED_EXTENSIONS = {".pdf", ".docx", ".doc", ".pptx", ".ppt", ".txt", ".md"}
 
@@ -56,54 +71,234 @@ async def root():
     """
 
 
+def _check_file_id(file_id: str) -> str:
+    """Les identifiants sont des UUID générés par le serveur ; tout autre format est refusé."""
+    try:
+        valid = str(uuid.UUID(file_id)) == file_id
+    except (TypeError, ValueError, AttributeError):
+        valid = False
+    if not valid:
+        raise HTTPException(400, detail="file_id invalide.")
+    return file_id
+
+
+def _persist_upload(key: str, content: bytes) -> None:
+    """Enregistre l'original ; une erreur de stockage n'interrompt pas la requête."""
+    try:
+        get_storage("uploads").write_bytes(key, content)
+    except Exception as e:
+        print(f"Erreur lors de l'enregistrement de {key}: {e}")
+
+
+def _save_analysis(file_id: str, analysis: DocumentAnalysis, theme: Theme, template_name: str) -> str:
+    """Conserve l'analyse (sans le texte brut), le thème et le template pour pouvoir re-générer l'infographie.
+
+    Renvoie la version de l'analyse enregistrée (ETag), qui versionne l'URL de la vignette.
+    """
+    settings = get_settings()
+    output = get_storage("output")
+    data = analysis.model_dump(mode="json", exclude={"raw_text"})
+    data["theme"] = theme.name
+    data["template"] = template_name
+    # L'ancienne vignette et l'ancien PDF ne correspondent plus
+    output.delete(f"{file_id}.png")
+    output.delete(f"{file_id}.pdf")
+    info = output.write_text(f"{file_id}.json", json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+    if settings.thumbnails_on_generate:
+        _write_thumbnail(file_id, analysis, theme)
+    return info.etag
+
+
+def _thumbnail_url(file_id: str, version: str) -> str:
+    return f"/thumbnail/{file_id}?v={version}"
+
+
+def _store_infographic(
+    file_id: str, analysis: DocumentAnalysis, theme: Theme, template_name: str = DEFAULT_TEMPLATE
+) -> str:
+    """Génère le HTML et l'enregistre avec l'analyse ; renvoie la version de l'analyse."""
+    html = generate_infographic_html(analysis, theme, template_name)
+    get_storage("output").write_text(f"{file_id}.html", html)
+    return _save_analysis(file_id, analysis, theme, template_name)
+
+
+def _load_analysis(file_id: str) -> tuple[DocumentAnalysis, Theme, str]:
+    """Analyse enregistrée, thème et template avec lesquels elle a été rendue."""
+    try:
+        data = json.loads(get_storage("output").read_text(f"{file_id}.json"))
+    except (FileNotFoundError, ValueError):
+        raise HTTPException(404, detail="Analyse introuvable pour cette infographie.")
+    analysis = DocumentAnalysis.model_validate(data)
+    theme = get_theme_by_name(data.get("theme") or "") or get_theme_for_analysis(analysis)
+    # Template retiré depuis le rendu (ou analyse antérieure) : template par défaut
+    template_name = data.get("template")
+    if template_name not in list_templates():
+        template_name = DEFAULT_TEMPLATE
+    return analysis, theme, template_name
+
+
+def _load_html(file_id: str) -> str:
+    try:
+        return get_storage("output").read_text(f"{file_id}.html")
+    except (FileNotFoundError, ValueError):
+        raise HTTPException(404, detail="Infographie introuvable.")
+
+
+def _write_thumbnail(file_id: str, analysis: DocumentAnalysis, theme: Theme) -> bytes:
+    # Pillow n'est chargé qu'à la première vignette
+    from app.generator.thumbnail import render_thumbnail
+    png = render_thumbnail(analysis, theme)
+    get_storage("output").write_bytes(f"{file_id}.png", png)
+    return png
+
+
+def _ndjson(record: dict) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _extract_lines(header: dict, chunks, selector: ChunkSelector, boilerplate: BoilerplateFilter, persist=None):
+    """Lignes NDJSON : en-tête, un fragment par page/section dès qu'il est extrait, bilan.
+
+    ``persist`` (tâche d'enregistrement de l'original) est attendue avant la ligne
+    ``done`` : le ``file_id`` est utilisable dès que le client a reçu le bilan.
+    """
+    yield _ndjson({"type": "header", **header})
+    try:
+        for chunk in chunks:
+            yield _ndjson({"type": "chunk", **chunk.model_dump()})
+    except Exception as e:
+        # Le statut 200 est déjà parti : l'erreur est signalée dans le flux
+        yield _ndjson({"type": "error", "detail": f"Erreur d'extraction: {e}"})
+        return
+    if persist is not None:
+        # Générateur lu dans le pool de threads : on attend la tâche dans la boucle d'événements
+        from_thread.run(asyncio.wait_for, persist, None)
+    yield _ndjson({
+        "type": "done",
+        "chunks": selector.count,
+        "chars": selector.chars,
+        "truncated": selector.truncated,
+        "boilerplate_bytes_removed": boilerplate.removed_bytes,
+    })
+
+
 @app.post("/extract-text")
-async def extract_text(file: UploadFile = File(...)):
+async def extract_text(
+    request: Request,
+    file: UploadFile = File(...),
+    stream: bool = Query(False, description="Réponse NDJSON fragment par fragment, pendant l'extraction"),
+    max_chars: int | None = Query(None, ge=1, description="Nombre maximal de caractères renvoyés"),
+    pages: str | None = Query(None, description="Pages, diapositives ou sections à extraire, ex. 1-5,8"),
+):
     """
-    Enregistre le fichier, extrait le texte et le renvoie (pour analyse par Puter côté frontend).
+    Extrait le texte directement depuis l'upload et le renvoie (pour analyse par Puter côté frontend).
+    Si ``persist_uploads`` est actif, l'original est enregistré pendant l'extraction ;
+    la réponse (ou, en flux, la ligne ``done``) n'est envoyée qu'une fois l'écriture
+    terminée : le ``file_id`` est alors utilisable par /generate-from-analysis.
+
+    Avec ``stream=true``, la réponse est un flux NDJSON (``header``, un ``chunk`` par
+    page ou section, puis ``done``) ; ``max_chars`` et ``pages`` limitent l'extraction
+    à la partie utile. La réponse est compressée (brotli ou gzip) si le client l'accepte.
+    Une place de l'étape ``extract`` est occupée jusqu'à la fin de l'envoi du flux.
     """
-    _ensure_dirs()
+    slot = await acquire_slot(request, "extract")
+    response = None
+    try:
+        response = await _extract_text(request, file, stream, max_chars, pages, slot)
+        return response
+    finally:
+        # En flux, la place est rendue à la fin de l'envoi du corps
+        if not isinstance(response, StreamingResponse):
+            slot.release()
+
+
+async def _extract_text(
+    request: Request,
+    file: UploadFile,
+    stream: bool,
+    max_chars: int | None,
+    pages: str | None,
+    slot: StageSlot,
+) -> Response:
     suffix = Path(file.filename or "").suffix.lower()
-    if suffix not in ALLOWED_EXTENSIONS:
+    if suffix not in ALLOWED_EXTENSIONS and suffix not in supported_extensions():
         raise HTTPException(
             400,
             detail=f"Format non supporté. Utilisez: {', '.join(ALLOWED_EXTENSIONS)}",
         )
+    try:
+        selector = ChunkSelector(parse_page_ranges(pages), max_chars)
+    except ValueError as e:
+        raise HTTPException(400, detail=str(e))
     file_id = str(uuid.uuid4())
     settings = get_settings()
-    upload_path = settings.upload_dir / f"{file_id}{suffix}"
     try:
         content = await file.read()
-        upload_path.write_bytes(content)
     except Exception as e:
-        raise HTTPException(500, detail=f"Erreur lors de l'enregistrement: {e}")
+        raise HTTPException(500, detail=f"Erreur lors de la lecture: {e}")
+    boilerplate = BoilerplateFilter()
     try:
-        extracted = extract_from_file(upload_path)
+        chunks = selector.select(boilerplate.filter(iter_extract(content, f"{file_id}{suffix}")))
+    except ValueError as e:
+        raise HTTPException(400, detail=str(e))
+    persist = None
+    if settings.persist_uploads:
+        persist = asyncio.ensure_future(run_in_threadpool(_persist_upload, f"{file_id}{suffix}", content))
+
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    headers = {"Vary": "Accept-Encoding"}
+    header = {"file_id": file_id, "filename": file.filename or "document"}
+    if stream:
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        # Chaque fragment est extrait dans le pool de threads ; la place est rendue à la fin
+        # du flux, ou par la tâche de fond si le client se déconnecte avant le premier fragment
+        return StreamingResponse(
+            slot.hold(compress_stream(_extract_lines(header, chunks, selector, boilerplate, persist), encoding)),
+            media_type="application/x-ndjson",
+            headers=headers,
+            background=BackgroundTask(slot.aclose),
+        )
+
+    def collect() -> str:
+        return "\n\n".join(chunk.text for chunk in chunks).strip()
+
+    try:
+        text = await run_in_threadpool(collect)
     except ValueError as e:
         raise HTTPException(400, detail=str(e))
     except Exception as e:
         raise HTTPException(500, detail=f"Erreur d'extraction: {e}")
-    return {
-        "file_id": file_id,
-        "filename": file.filename or "document",
-        "text": extracted.raw_text,
+    finally:
+        if persist is not None:
+            await persist
+    payload = {
+        **header,
+        "text": text,
+        "truncated": selector.truncated,
+        "boilerplate_bytes_removed": boilerplate.removed_bytes,
     }
+    body, applied = compress_bytes(json.dumps(payload, ensure_ascii=False).encode("utf-8"), encoding)
+    if applied:
+        headers["Content-Encoding"] = applied
+    return Response(body, media_type="application/json", headers=headers)
 
 
 @app.post("/generate-from-analysis")
-async def generate_from_analysis(body: dict = Body(...)):
+def generate_from_analysis(body: dict = Body(...)):
     """
     Génère l'infographie à partir d'une analyse fournie (ex. retour Puter.ai.chat).
     Body: { "file_id": "...", "filename": "...", "analysis": { ... } }
     """
-    _ensure_dirs()
     file_id = body.get("file_id")
     filename = body.get("filename") or "document"
     analysis = body.get("analysis") or {}
     if not file_id:
         raise HTTPException(400, detail="file_id requis.")
+    _check_file_id(file_id)
     settings = get_settings()
-    candidates = list(settings.upload_dir.glob(f"{file_id}.*"))
-    if not candidates:
+    # Sans persistance des uploads, il n'y a rien à vérifier dans le stockage
+    if settings.persist_uploads and not get_storage("uploads").list(f"{file_id}."):
         raise HTTPException(400, detail="Fichier introuvable. Uploadez d'abord via /extract-text.")
     try:
         doc_analysis = DocumentAnalysis.model_validate(_normalize_analysis(analysis))
@@ -113,13 +308,12 @@ async def generate_from_analysis(body: dict = Body(...)):
     if not doc_analysis.title or not str(doc_analysis.title).strip():
         doc_analysis.title = fallback_title
     theme = get_theme_for_analysis(doc_analysis)
-    output_path = settings.output_dir / f"{file_id}.html"
-    html = generate_infographic_html(doc_analysis, theme)
-    output_path.write_text(html, encoding="utf-8")
+    version = _store_infographic(file_id, doc_analysis, theme)
     return {
         "id": file_id,
         "title": doc_analysis.title or fallback_title,
         "preview_url": f"/infographic/{file_id}",
+        "thumbnail_url": _thumbnail_url(file_id, version),
         "download_url": f"/download/{file_id}",
     }
 
@@ -163,14 +357,13 @@ def _normalize_analysis(data: dict) -> dict:
     }
 
 
-@app.post("/generate")
-async def generate_infographic(file: UploadFile = File(...)):
+@app.post("/generate", dependencies=[admit("generate")])
+async def generate_infographic(background_tasks: BackgroundTasks, file: UploadFile = File(...)):
     """
     Upload un document (PDF, Word, PowerPoint, texte) et renvoie l'infographie en HTML.
     """
-    _ensure_dirs()
     suffix = Path(file.filename or "").suffix.lower()
-    if suffix not in ALLOWED_EXTENSIONS:
+    if suffix not in ALLOWED_EXTENSIONS and suffix not in supported_extensions():
         raise HTTPException(
             400,
             detail=f"Format non supporté. Utilisez: {', '.join(ALLOWED_EXTENSIONS)}",
@@ -178,109 +371,181 @@ async def generate_infographic(file: UploadFile = File(...)):
 
     file_id = str(uuid.uuid4())
     settings = get_settings()
-    upload_path = settings.upload_dir / f"{file_id}{suffix}"
-    output_path = settings.output_dir / f"{file_id}.html"
 
     try:
         content = await file.read()
-        upload_path.write_bytes(content)
     except Exception as e:
-        raise HTTPException(500, detail=f"Erreur lors de l'enregistrement: {e}")
+        raise HTTPException(500, detail=f"Erreur lors de la lecture: {e}")
 
     try:
-        extracted = extract_from_file(upload_path)
+        chunks = iter_extract(content, f"{file_id}{suffix}")
     except ValueError as e:
         raise HTTPException(400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(500, detail=f"Erreur d'extraction: {e}")
+    if settings.persist_uploads:
+        background_tasks.add_task(_persist_upload, f"{file_id}{suffix}", content)
 
+    # En-têtes, pieds de page et mentions répétés sont retirés avant l'analyse
+    boilerplate = BoilerplateFilter()
     try:
-        analysis = await analyze_content(extracted)
+        # Extraction et analyse en pipeline : chaque page est analysée dès qu'elle est lue
+        analysis = await analyze_content_stream(boilerplate.filter(chunks))
         # Titre de repli : nom du fichier sans extension
         fallback_title = Path(file.filename or "").stem or "Infographie"
         if not analysis.title or not analysis.title.strip():
             analysis.title = fallback_title
         theme = get_theme_for_analysis(analysis)
-        html = generate_infographic_html(analysis, theme)
-        output_path.write_text(html, encoding="utf-8")
+        # Rendu et écritures (éventuellement réseau, S3) hors de la boucle d'événements
+        version = await run_in_threadpool(_store_infographic, file_id, analysis, theme)
     except Exception as e:
         import traceback
         traceback.print_exc()
-        raise HTTPException(500, detail=f"Erreur lors de l'analyse ou génération: {str(e)}")
+        raise HTTPException(500, detail=f"Erreur lors de l'extraction, l'analyse ou la génération: {str(e)}")
 
     return {
         "id": file_id,
         "title": analysis.title or fallback_title,
         "preview_url": f"/infographic/{file_id}",
+        "thumbnail_url": _thumbnail_url(file_id, version),
+        "download_url": f"/download-pdf/{file_id}",
+        "boilerplate_bytes_removed": boilerplate.removed_bytes,
+    }
+
+
+@app.get("/themes")
+async def list_themes():
+    """Thèmes et templates utilisables pour re-générer une infographie."""
+    return {
+        "themes": [theme.name for theme in THEMES],
+        "templates": list_templates(),
+    }
+
+
+@app.post("/rerender/{file_id}")
+def rerender_infographic(
+    file_id: str,
+    theme: str | None = Query(None, description="Nom d'un thème (voir /themes)"),
+    template: str | None = Query(None, description="Template HTML (voir /themes)"),
+):
+    """
+    Re-génère l'infographie depuis l'analyse enregistrée, avec un autre thème
+    ou la version courante du template — sans extraction ni appel au LLM.
+    Sans ``theme`` ni ``template``, ceux du rendu précédent sont conservés.
+    """
+    analysis, chosen_theme, template_name = _load_analysis(file_id)
+    if theme:
+        chosen_theme = get_theme_by_name(theme)
+        if chosen_theme is None:
+            raise HTTPException(400, detail=f"Thème inconnu: {theme}")
+    if template and template not in list_templates():
+        raise HTTPException(400, detail=f"Template inconnu: {template}")
+    version = _store_infographic(file_id, analysis, chosen_theme, template or template_name)
+    return {
+        "id": file_id,
+        "title": analysis.title,
+        "theme": chosen_theme.name,
+        "template": template or template_name,
+        "preview_url": f"/infographic/{file_id}",
+        "thumbnail_url": _thumbnail_url(file_id, version),
         "download_url": f"/download-pdf/{file_id}",
     }
 
 
 @app.get("/infographic/{file_id}", response_class=HTMLResponse)
-async def view_infographic(file_id: str):
+def view_infographic(file_id: str, request: Request):
     """Affiche l'infographie générée dans le navigateur."""
-    settings = get_settings()
-    path = settings.output_dir / f"{file_id}.html"
-    if not path.is_file():
-        raise HTTPException(404, detail="Infographie introuvable.")
-    return path.read_text(encoding="utf-8")
+    return storage_response(
+        request, get_storage("output"), f"{file_id}.html", "text/html",
+        not_found="Infographie introuvable.",
+    )
+
+
+@app.get("/thumbnail/{file_id}")
+def thumbnail(
+    file_id: str,
+    request: Request,
+    v: str | None = Query(None, description="Version de l'analyse (fournie dans thumbnail_url)"),
+):
+    """Vignette PNG de l'infographie, générée à la première demande puis servie depuis le stockage.
+
+    Mise en cache définitive seulement si ``v`` est la version courante ; sinon
+    (URL sans version ou périmée) le client revalide à chaque fois par ETag.
+    """
+    output = get_storage("output")
+    current = output.stat(f"{file_id}.json") if v else None
+    cache_control = THUMBNAIL_CACHE_CONTROL if current is not None and current.etag == v else THUMBNAIL_REVALIDATE
+    headers = {"Cache-Control": cache_control}
+    info = output.stat(f"{file_id}.png")
+    # Vignette antérieure à l'analyse courante (rendue pendant un re-rendu) : on la refait
+    if info is not None and (current is None or info.modified >= current.modified):
+        return storage_response(request, output, f"{file_id}.png", "image/png", headers, info=info)
+    analysis, theme, _ = _load_analysis(file_id)
+    return Response(_write_thumbnail(file_id, analysis, theme), media_type="image/png", headers=headers)
+
+
+@app.get("/assets/{name}")
+def stylesheet_asset(name: str):
+    """Feuilles de style versionnées (nom = empreinte du contenu), mises en cache définitivement.
+
+    Les versions antérieures restent servies depuis le stockage partagé.
+    """
+    css = get_asset(name)
+    if css is None:
+        raise HTTPException(404, detail="Ressource introuvable.")
+    return Response(css, media_type="text/css", headers={"Cache-Control": CACHE_CONTROL})
 
 
 @app.get("/download/{file_id}")
-async def download_infographic(file_id: str):
-    """Télécharge l'infographie en fichier HTML (pour l'instant, PDF à venir)."""
-    settings = get_settings()
-    path = settings.output_dir / f"{file_id}.html"
-    if not path.is_file():
-        raise HTTPException(404, detail="Infographie introuvable.")
-    return FileResponse(
-        path,
+def download_infographic(file_id: str):
+    """Télécharge l'infographie en fichier HTML autonome (styles intégrés)."""
+    return Response(
+        inline_stylesheets(_load_html(file_id)),
         media_type="text/html",
-        filename=f"infographic_{file_id}.html",
+        headers={"Content-Disposition": f'attachment; filename="infographic_{file_id}.html"'},
     )
 
 
-@app.get("/download-pdf/{file_id}")
-async def download_infographic_pdf(file_id: str):
-    """Génère et télécharge l'infographie en PDF via WeasyPrint."""
+def _render_pdf(file_id: str):
+    """Génère le PDF via WeasyPrint et l'enregistre ; renvoie ses métadonnées."""
     try:
         from weasyprint import HTML, CSS
     except ImportError:
         raise HTTPException(500, detail="WeasyPrint non installé. Impossible de générer le PDF.")
 
-    settings = get_settings()
-    html_path = settings.output_dir / f"{file_id}.html"
-    
-    if not html_path.is_file():
-        raise HTTPException(404, detail="Infographie HTML introuvable.")
-
-    pdf_path = settings.output_dir / f"{file_id}.pdf"
-    
-    # Générer le PDF s'il n'existe pas encore ou le régénérer à la demande
+    # On lit le HTML, avec les feuilles de style intégrées
+    html_content = inline_stylesheets(_load_html(file_id))
     try:
-        # On lit le HTML
-        html_content = html_path.read_text(encoding="utf-8")
-        
         # On peut injecter du CSS spécifique pour l'impression ici si nécessaire
         print_css = CSS(string="@page { size: A4; margin: 0; } body { -webkit-print-color-adjust: exact; }")
         
         # Génération WeasyPrint
-        # base_url est important pour charger les images locales (ex: /images/6.png)
-        HTML(string=html_content, base_url=str(PROJECT_ROOT)).write_pdf(
-            target=pdf_path, 
+        # base_url est important pour charger les images locales (ex: /images/6.png) ;
+        # le fetcher les lit sur disque et met en cache les polices distantes
+        pdf = HTML(string=html_content, base_url=str(PROJECT_ROOT), url_fetcher=get_pdf_url_fetcher()).write_pdf(
             stylesheets=[print_css]
         )
     except Exception as e:
         print(f"Erreur WeasyPrint: {e}")
         raise HTTPException(500, detail=f"Erreur lors de la génération du PDF: {e}")
+    return get_storage("output").write_bytes(f"{file_id}.pdf", pdf)
+
 
-    return FileResponse(
-        pdf_path,
-        media_type="application/pdf",
-        filename=f"infographic_{file_id}.pdf",
+@app.get("/download-pdf/{file_id}")
+async def download_infographic_pdf(file_id: str, request: Request):
+    """Génère et télécharge l'infographie en PDF via WeasyPrint."""
+    output = get_storage("output")
+    key = f"{file_id}.pdf"
+    headers = {"Content-Disposition": f'attachment; filename="infographic_{file_id}.pdf"'}
+    # PDF déjà généré pour cette version de l'infographie (supprimé à chaque re-rendu) :
+    # servi tel quel, y compris par plages pour les lecteurs PDF, sans contrôle d'admission
+    info = await run_in_threadpool(output.stat, key)
+    if info is None:
+        async with admitted(request, "pdf"):
+            info = await run_in_threadpool(_render_pdf, file_id)
+    return await run_in_threadpool(
+        storage_response, request, output, key, "application/pdf", headers, info=info
     )
 
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    from app.server import serve
+    serve()
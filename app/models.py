@@ -8,6 +8,16 @@ class ExtractedContent(BaseModel):
     raw_text: str = Field(description="Texte brut complet")
     title: Optional[str] = Field(None, description="Titre du document")
     sections: list[dict] = Field(default_factory=list, description="Sections avec titres et contenu")
+    truncated: bool = Field(False, description="Texte brut coupé à la taille maximale conservée")
+
+
+class ExtractedChunk(BaseModel):
+    """Fragment de document (page, diapositive ou section) produit au fil de l'extraction."""
+    index: int = Field(description="Position du fragment dans le document (à partir de 1)")
+    kind: str = "section"  # page, slide, section
+    title: Optional[str] = None
+    text: str = ""
+    document_title: Optional[str] = Field(None, description="Titre du document, porté par le premier fragment")
 
 
 class KeyIdea(BaseModel):
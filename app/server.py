@@ -0,0 +1,144 @@
+"""Lancement du serveur : rechargement automatique en développement, multi-processus en production.
+
+En production, gunicorn charge l'application et les bibliothèques lourdes
+(NumPy, pypdf, python-docx/pptx, WeasyPrint, templates Jinja) une seule fois
+dans le processus maître, puis crée les workers par ``fork`` : ces pages
+mémoire sont partagées au lieu d'être dupliquées dans chaque worker. Sur
+SIGTERM, chaque worker cesse d'accepter des connexions et termine les
+requêtes en cours (tâches de fond comprises) pendant ``graceful_timeout``.
+
+Le maître n'accède jamais au stockage : un client boto3 créé avant le fork
+serait partagé par les workers, ce qui n'est pas sûr.
+"""
+import importlib
+import os
+from app.config import Settings, get_settings
+
+
+APP_PATH = "app.main:app"
+# Importés avant le fork ; les optionnels absents sont ignorés
+PRELOAD_MODULES = [
+    "numpy",
+    "pypdf",
+    "docx",
+    "pptx",
+    "PIL.Image",
+    "PIL.ImageDraw",
+    "jinja2",
+    "weasyprint",
+    "openai",
+    "boto3",
+]
+
+
+def default_workers() -> int:
+    """Nombre de CPU réellement attribués au processus (conteneur compris)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def preload() -> None:
+    """Importe les modules lourds et prépare feuilles de style et templates."""
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # Dépendance optionnelle absente ou bibliothèque système manquante (WeasyPrint)
+            continue
+    from app.generator import generate_infographic_html
+    from app.generator.assets import build_assets, enable_persistence
+    from app.models import DocumentAnalysis
+    # Feuilles construites en mémoire seulement : les workers les écrivent après le fork
+    enable_persistence(False)
+    build_assets()
+    # Compile le template et initialise le rendu SVG une fois pour toutes
+    generate_infographic_html(DocumentAnalysis(title="preload", categories_for_chart={"a": 1}))
+
+
+def post_fork(server, worker) -> None:
+    """Hook gunicorn : stockage propre au worker, écriture des feuilles réactivée."""
+    from app.generator.assets import enable_persistence
+    from app.storage import get_storage
+    get_storage.cache_clear()
+    enable_persistence(True)
+
+
+def _worker_count(settings: Settings) -> int:
+    return settings.workers if settings.workers > 0 else default_workers()
+
+
+def run_production(settings: Settings) -> None:
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        # Windows (pas de fork) : superviseur multi-processus d'uvicorn, sans préchargement
+        import uvicorn
+        uvicorn.run(
+            APP_PATH,
+            host=settings.host,
+            port=settings.port,
+            workers=_worker_count(settings),
+            timeout_graceful_shutdown=settings.graceful_timeout,
+            proxy_headers=True,
+            forwarded_allow_ips=settings.forwarded_allow_ips,
+        )
+        return
+
+    class ProductionServer(BaseApplication):
+        def load_config(self):
+            options = {
+                "bind": f"{settings.host}:{settings.port}",
+                "workers": _worker_count(settings),
+                "worker_class": "app.server.UvicornWorker",
+                "preload_app": True,
+                "post_fork": post_fork,
+                "graceful_timeout": settings.graceful_timeout,
+                "timeout": settings.worker_timeout,
+                "keepalive": 5,
+                # Lu par le worker uvicorn pour l'adresse client (X-Forwarded-For)
+                "forwarded_allow_ips": settings.forwarded_allow_ips,
+                "accesslog": "-",
+                "errorlog": "-",
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            preload()
+            from app.main import app
+            return app
+
+    ProductionServer().run()
+
+
+def serve(settings: Settings | None = None) -> None:
+    """Point d'entrée commun à ``run.py`` et ``python -m app.main``, selon ``SERVER_MODE``."""
+    settings = settings or get_settings()
+    if settings.server_mode == "production":
+        run_production(settings)
+        return
+    import uvicorn
+    uvicorn.run(
+        APP_PATH,
+        host=settings.host,
+        port=settings.port,
+        reload=True,
+        forwarded_allow_ips=settings.forwarded_allow_ips,
+    )
+
+
+try:
+    from uvicorn.workers import UvicornWorker as _BaseWorker
+
+    class UvicornWorker(_BaseWorker):
+        """Worker gunicorn avec uvloop et httptools (fournis par ``uvicorn[standard]``)."""
+        CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on", "proxy_headers": True}
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # Les requêtes en cours sont abandonnées proprement juste avant le SIGKILL du maître
+            self.config.timeout_graceful_shutdown = max(self.cfg.graceful_timeout - 1, 1)
+except ImportError:
+    pass
@@ -0,0 +1,17 @@
+"""Stockage des fichiers uploadés et des artefacts générés (disque local ou S3)."""
+from .base import ObjectInfo, Storage
+from .cache import CachedStorage
+from .factory import get_storage
+from .local import LocalStorage
+from .responses import storage_response
+from .s3 import S3Storage
+
+__all__ = [
+    "CachedStorage",
+    "LocalStorage",
+    "ObjectInfo",
+    "S3Storage",
+    "Storage",
+    "get_storage",
+    "storage_response",
+]
@@ -0,0 +1,67 @@
+"""Interface commune des stockages d'artefacts (uploads, HTML, analyses, PDF, vignettes)."""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+
+CHUNK_SIZE = 256 * 1024
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    """Métadonnées d'un objet stocké ; ``etag`` change à chaque réécriture."""
+    size: int
+    etag: str
+    modified: float
+
+
+def check_key(key: str) -> str:
+    """Refuse les clés qui sortiraient de la zone de stockage."""
+    parts = key.split("/")
+    if not key or key.startswith("/") or any(part in ("", ".", "..") for part in parts):
+        raise ValueError(f"Clé de stockage invalide: {key!r}")
+    return key
+
+
+class Storage(ABC):
+    """Stockage clé → octets, lu et écrit par blocs.
+
+    ``iter_bytes`` accepte une plage ``[start, end)`` pour servir les requêtes
+    HTTP partielles sans lire l'objet entier ; un objet absent lève
+    ``FileNotFoundError``.
+    """
+
+    @abstractmethod
+    def stat(self, key: str) -> ObjectInfo | None:
+        """Métadonnées de l'objet, ou ``None`` s'il n'existe pas."""
+
+    @abstractmethod
+    def iter_bytes(self, key: str, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+        """Contenu de l'objet par blocs, éventuellement limité à une plage."""
+
+    @abstractmethod
+    def write_stream(self, key: str, chunks: Iterable[bytes]) -> ObjectInfo:
+        """Écrit l'objet à partir d'un flux de blocs ; l'ancienne version reste lisible jusqu'à la fin."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Supprime l'objet (sans erreur s'il n'existe pas)."""
+
+    @abstractmethod
+    def list(self, prefix: str = "") -> list[str]:
+        """Clés commençant par ``prefix``."""
+
+    def exists(self, key: str) -> bool:
+        return self.stat(key) is not None
+
+    def read_bytes(self, key: str) -> bytes:
+        return b"".join(self.iter_bytes(key))
+
+    def write_bytes(self, key: str, data: bytes) -> ObjectInfo:
+        return self.write_stream(key, [data])
+
+    def read_text(self, key: str) -> str:
+        return self.read_bytes(key).decode("utf-8")
+
+    def write_text(self, key: str, text: str) -> ObjectInfo:
+        return self.write_bytes(key, text.encode("utf-8"))
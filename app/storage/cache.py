@@ -0,0 +1,129 @@
+"""Cache disque local devant un stockage distant (lecture traversante)."""
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+from .base import ObjectInfo, Storage
+from .local import LocalStorage
+
+
+class CachedStorage(Storage):
+    """Garde sur chaque nœud une copie des objets lus ou écrits.
+
+    Une copie est servie sans aller-retour réseau pendant ``ttl`` secondes,
+    puis revalidée par ``stat`` (comparaison d'``etag``) : un re-rendu fait
+    sur un autre nœud est donc visible au plus tard après ``ttl``. Les copies
+    les moins récemment utilisées sont supprimées au-delà de ``max_bytes``.
+    """
+
+    def __init__(self, backend: Storage, cache_dir: Path, ttl: float = 30, max_bytes: int = 1024 ** 3):
+        self.backend = backend
+        self.files = LocalStorage(cache_dir)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _name(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.files.root / f"{self._name(key)}.json"
+
+    def _read_meta(self, key: str) -> dict | None:
+        try:
+            return json.loads(self._meta_path(key).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_meta(self, key: str, info: ObjectInfo) -> None:
+        meta = {"key": key, "size": info.size, "etag": info.etag, "modified": info.modified, "checked": time.time()}
+        self._meta_path(key).write_text(json.dumps(meta), encoding="utf-8")
+
+    def _drop(self, key: str) -> None:
+        self.files.delete(self._name(key))
+        self._meta_path(key).unlink(missing_ok=True)
+
+    def _cached(self, key: str) -> ObjectInfo | None:
+        """Copie locale encore valide (revalidée auprès du stockage si ``ttl`` est dépassé)."""
+        meta = self._read_meta(key)
+        if meta is None or self.files.stat(self._name(key)) is None:
+            return None
+        info = ObjectInfo(size=meta["size"], etag=meta["etag"], modified=meta["modified"])
+        if time.time() - meta["checked"] < self.ttl:
+            return info
+        current = self.backend.stat(key)
+        if current is None or current.etag != info.etag:
+            self._drop(key)
+            return None
+        self._write_meta(key, current)
+        return current
+
+    def _fill(self, key: str) -> ObjectInfo:
+        info = self.backend.stat(key)
+        if info is None:
+            raise FileNotFoundError(key)
+        self.files.write_stream(self._name(key), self.backend.iter_bytes(key))
+        self._write_meta(key, info)
+        self._evict()
+        return info
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            for entry in os.scandir(self.files.root):
+                if entry.is_file() and not entry.name.endswith(".json") and not entry.name.startswith(".tmp-"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.name))
+            total = sum(size for _, size, _ in entries)
+            for _, size, name in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                self.files.delete(name)
+                (self.files.root / f"{name}.json").unlink(missing_ok=True)
+                total -= size
+
+    def stat(self, key: str) -> ObjectInfo | None:
+        return self._cached(key) or self.backend.stat(key)
+
+    def iter_bytes(self, key: str, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+        if self._cached(key) is None:
+            self._fill(key)
+        path = self.files.root / self._name(key)
+        try:
+            # La date de modification sert d'horodatage LRU pour l'éviction
+            os.utime(path)
+            return self.files.iter_bytes(self._name(key), start, end)
+        except FileNotFoundError:
+            # Copie évincée entre-temps : lecture directe
+            return self.backend.iter_bytes(key, start, end)
+
+    def write_stream(self, key: str, chunks: Iterable[bytes]) -> ObjectInfo:
+        self._drop(key)
+        name = self._name(key)
+        copy = self.files.root / f".tmp-{name}"
+        copy.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with copy.open("wb") as out:
+                def tee() -> Iterator[bytes]:
+                    for chunk in chunks:
+                        out.write(chunk)
+                        yield chunk
+                info = self.backend.write_stream(key, tee())
+            os.replace(copy, self.files.root / name)
+        except BaseException:
+            copy.unlink(missing_ok=True)
+            raise
+        self._write_meta(key, info)
+        self._evict()
+        return info
+
+    def delete(self, key: str) -> None:
+        self._drop(key)
+        self.backend.delete(key)
+
+    def list(self, prefix: str = "") -> list[str]:
+        return self.backend.list(prefix)
@@ -0,0 +1,36 @@
+"""Choix du stockage d'après la configuration."""
+from functools import lru_cache
+from app.config import get_settings
+from .base import Storage
+from .cache import CachedStorage
+from .local import LocalStorage
+from .s3 import S3Storage
+
+
+AREAS = ("uploads", "output")
+
+
+@lru_cache(maxsize=None)
+def get_storage(area: str) -> Storage:
+    """Stockage partagé d'une zone : ``uploads`` (originaux) ou ``output`` (artefacts générés)."""
+    if area not in AREAS:
+        raise ValueError(f"Zone de stockage inconnue: {area}")
+    settings = get_settings()
+    if settings.storage_backend == "local":
+        return LocalStorage(settings.upload_dir if area == "uploads" else settings.output_dir)
+    storage: Storage = S3Storage(
+        bucket=settings.s3_bucket,
+        prefix=f"{settings.s3_prefix}{area}/",
+        endpoint_url=settings.s3_endpoint_url,
+        region=settings.s3_region,
+        access_key=settings.s3_access_key,
+        secret_key=settings.s3_secret_key,
+    )
+    if settings.storage_cache_dir is not None:
+        storage = CachedStorage(
+            storage,
+            settings.storage_cache_dir / area,
+            ttl=settings.storage_cache_ttl,
+            max_bytes=settings.storage_cache_max_mb * 1024 * 1024,
+        )
+    return storage
@@ -0,0 +1,71 @@
+"""Stockage sur le disque local (mode par défaut, un seul nœud ou volume partagé)."""
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Iterator
+from .base import CHUNK_SIZE, ObjectInfo, Storage, check_key
+
+
+class LocalStorage(Storage):
+    """Objets stockés comme fichiers sous ``root`` ; écriture atomique (fichier temporaire + renommage)."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / check_key(key)
+
+    def stat(self, key: str) -> ObjectInfo | None:
+        try:
+            st = self._path(key).stat()
+        except FileNotFoundError:
+            return None
+        return ObjectInfo(size=st.st_size, etag=f"{st.st_mtime_ns:x}-{st.st_size:x}", modified=st.st_mtime)
+
+    def iter_bytes(self, key: str, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+        # Ouvert avant le premier bloc : l'absence est signalée dès l'appel
+        stream = self._path(key).open("rb")
+        return self._read_range(stream, start, end)
+
+    @staticmethod
+    def _read_range(stream, start: int, end: int | None) -> Iterator[bytes]:
+        with stream:
+            stream.seek(start)
+            remaining = None if end is None else max(end - start, 0)
+            while remaining is None or remaining > 0:
+                block = stream.read(CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining))
+                if not block:
+                    break
+                if remaining is not None:
+                    remaining -= len(block)
+                yield block
+
+    def write_stream(self, key: str, chunks: Iterable[bytes]) -> ObjectInfo:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                for chunk in chunks:
+                    out.write(chunk)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return self.stat(key)
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def list(self, prefix: str = "") -> list[str]:
+        if not self.root.is_dir():
+            return []
+        directory, _, name = prefix.rpartition("/")
+        base = self.root / directory if directory else self.root
+        if not base.is_dir():
+            return []
+        return sorted(
+            path.relative_to(self.root).as_posix()
+            for path in base.iterdir()
+            if path.is_file() and path.name.startswith(name) and not path.name.startswith(".tmp-")
+        )
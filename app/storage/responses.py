@@ -0,0 +1,74 @@
+"""Réponses HTTP en flux depuis le stockage, avec ETag et requêtes partielles (Range)."""
+import re
+from email.utils import formatdate
+from fastapi import HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from .base import ObjectInfo, Storage
+
+
+PATTERN_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Plage ``[start, end)`` demandée ; ``None`` pour servir l'objet entier.
+
+    Les demandes multi-plages, mal formées ou dont la fin précède le début
+    sont ignorées (réponse complète, comme le prévoit la RFC 9110) ; une
+    plage commençant au-delà de l'objet lève une 416.
+    """
+    match = PATTERN_RANGE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first == "":
+        # Suffixe : les N derniers octets
+        start, end = max(size - int(last), 0), size
+    else:
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        end = min(int(last) + 1, size) if last else size
+    if start >= size:
+        raise HTTPException(416, detail="Plage demandée invalide.", headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+
+def storage_response(
+    request: Request,
+    storage: Storage,
+    key: str,
+    media_type: str,
+    headers: dict[str, str] | None = None,
+    not_found: str = "Fichier introuvable.",
+    info: ObjectInfo | None = None,
+) -> Response:
+    """Sert l'objet ``key`` par blocs ; gère ``If-None-Match``, ``Range`` et ``If-Range``."""
+    info = info or storage.stat(key)
+    if info is None:
+        raise HTTPException(404, detail=not_found)
+    etag = f'"{info.etag}"'
+    headers = {
+        **(headers or {}),
+        "ETag": etag,
+        "Last-Modified": formatdate(info.modified, usegmt=True),
+        "Accept-Ranges": "bytes",
+    }
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if range_header and request.headers.get("if-range", etag) == etag:
+        byte_range = _parse_range(range_header, info.size)
+    try:
+        if byte_range is None:
+            body = storage.iter_bytes(key)
+            headers["Content-Length"] = str(info.size)
+            return StreamingResponse(body, media_type=media_type, headers=headers)
+        start, end = byte_range
+        body = storage.iter_bytes(key, start, end)
+    except FileNotFoundError:
+        raise HTTPException(404, detail=not_found)
+    headers["Content-Range"] = f"bytes {start}-{end - 1}/{info.size}"
+    headers["Content-Length"] = str(end - start)
+    return StreamingResponse(body, status_code=206, media_type=media_type, headers=headers)
@@ -0,0 +1,116 @@
+"""Stockage S3 ou compatible (MinIO, Ceph, R2…) pour les déploiements à plusieurs nœuds."""
+import mimetypes
+import tempfile
+from typing import Iterable, Iterator
+from .base import CHUNK_SIZE, ObjectInfo, Storage, check_key
+
+
+# Au-delà, le flux en cours d'écriture passe de la mémoire à un fichier temporaire
+SPOOL_SIZE = 8 * 1024 * 1024
+
+
+class S3Storage(Storage):
+    """Objets stockés dans ``bucket`` sous ``prefix`` ; boto3 n'est importé qu'à l'utilisation.
+
+    ``endpoint_url`` permet de viser un service compatible S3 (MinIO en local,
+    par exemple) ; l'adressage se fait alors par chemin plutôt que par sous-domaine.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        endpoint_url: str | None = None,
+        region: str | None = None,
+        access_key: str = "",
+        secret_key: str = "",
+    ):
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError:
+            raise RuntimeError("boto3 non installé : impossible d'utiliser le stockage S3.")
+        if not bucket:
+            raise ValueError("S3_BUCKET requis pour le stockage S3.")
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url or None,
+            region_name=region or None,
+            aws_access_key_id=access_key or None,
+            aws_secret_access_key=secret_key or None,
+            config=Config(
+                s3={"addressing_style": "path" if endpoint_url else "auto"},
+                retries={"max_attempts": 3, "mode": "standard"},
+            ),
+        )
+
+    def _key(self, key: str) -> str:
+        return self.prefix + check_key(key)
+
+    @staticmethod
+    def _missing(error) -> bool:
+        code = error.response.get("Error", {}).get("Code")
+        return code in ("404", "NoSuchKey", "NotFound")
+
+    def stat(self, key: str) -> ObjectInfo | None:
+        from botocore.exceptions import ClientError
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+        except ClientError as e:
+            if self._missing(e):
+                return None
+            raise
+        return ObjectInfo(
+            size=head["ContentLength"],
+            etag=head["ETag"].strip('"'),
+            modified=head["LastModified"].timestamp(),
+        )
+
+    def iter_bytes(self, key: str, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+        from botocore.exceptions import ClientError
+        params = {"Bucket": self.bucket, "Key": self._key(key)}
+        if start or end is not None:
+            if end is not None and end <= start:
+                return iter(())
+            params["Range"] = f"bytes={start}-{'' if end is None else end - 1}"
+        try:
+            body = self.client.get_object(**params)["Body"]
+        except ClientError as e:
+            if self._missing(e):
+                raise FileNotFoundError(key) from e
+            raise
+        return self._read_body(body)
+
+    @staticmethod
+    def _read_body(body) -> Iterator[bytes]:
+        try:
+            yield from body.iter_chunks(CHUNK_SIZE)
+        finally:
+            body.close()
+
+    def write_stream(self, key: str, chunks: Iterable[bytes]) -> ObjectInfo:
+        content_type, _ = mimetypes.guess_type(key)
+        # upload_fileobj découpe en envoi multipart si l'objet est gros
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE) as spool:
+            for chunk in chunks:
+                spool.write(chunk)
+            spool.seek(0)
+            self.client.upload_fileobj(
+                spool,
+                self.bucket,
+                self._key(key),
+                ExtraArgs={"ContentType": content_type or "application/octet-stream"},
+            )
+        return self.stat(key)
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
+
+    def list(self, prefix: str = "") -> list[str]:
+        keys = []
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix + prefix):
+            keys.extend(item["Key"][len(self.prefix):] for item in page.get("Contents", []))
+        return sorted(keys)
@@ -1,5 +1,5 @@
-"""Lance le serveur de la plateforme infographie."""
-import uvicorn
+"""Lance le serveur de la plateforme infographie (mode choisi par SERVER_MODE)."""
+from app.server import serve
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    serve()
@@ -0,0 +1,75 @@
+"""Mesure le démarrage d'un worker : temps d'import de l'application et mémoire résidente.
+
+Chaque mesure est faite dans un interpréteur neuf. Le scénario « eager »
+importe en plus les bibliothèques d'extraction et Pillow, comme le faisait
+l'ancien registre ; l'écart donne le gain du chargement à la demande.
+
+    python scripts/bench_startup.py [--runs 5]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+for name in {extra!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+rss = None
+try:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                rss = int(line.split()[1]) / 1024
+except OSError:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+loaded = [m for m in ("pypdf", "docx", "pptx", "PIL.Image", "numpy") if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "rss_mb": rss, "loaded": loaded}}))
+"""
+
+SCENARIOS = {
+    "lazy": [],
+    "eager": [
+        "app.extractors.pdf_extractor",
+        "app.extractors.docx_extractor",
+        "app.extractors.pptx_extractor",
+        "app.generator.thumbnail",
+    ],
+}
+
+
+def measure(extra: list[str]) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(extra=extra)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'scénario':<10}{'import (ms)':>14}{'RSS (Mo)':>12}  modules chargés")
+    for name, extra in SCENARIOS.items():
+        results = [measure(extra) for _ in range(args.runs)]
+        seconds = statistics.median(r["seconds"] for r in results) * 1000
+        rss = statistics.median(r["rss_mb"] for r in results)
+        print(f"{name:<10}{seconds:>14.0f}{rss:>12.1f}  {', '.join(results[-1]['loaded']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Télécharge les polices Google Fonts de l'infographie dans app/static/fonts.
+
+Le PDF est alors rendu avec les mêmes polices que la page, sans accès réseau
+au moment du rendu (``PDF_ALLOWED_HOSTS`` peut rester vide) : le fetcher
+WeasyPrint sert ``fonts.css`` à la place de la feuille Google Fonts.
+
+    python scripts/fetch_fonts.py [--template app/generator/templates/infographic.html]
+"""
+import argparse
+import hashlib
+import re
+import sys
+import urllib.request
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+FONTS_DIR = PROJECT_ROOT / "app" / "static" / "fonts"
+DEFAULT_TEMPLATE = PROJECT_ROOT / "app" / "generator" / "templates" / "infographic.html"
+
+PATTERN_FONTS_LINK = re.compile(r'href="(https://fonts\.googleapis\.com/css2?\?[^"]+)"')
+PATTERN_FONT_URL = re.compile(r"url\((https://fonts\.gstatic\.com/[^)]+)\)")
+# Sans User-Agent de navigateur récent, Google Fonts renvoie des fichiers TrueType,
+# lus par WeasyPrint sans dépendance supplémentaire
+USER_AGENT = "Python-urllib"
+
+
+def _get(url: str) -> bytes:
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+def fetch_fonts(template: Path, target: Path) -> list[Path]:
+    """Écrit ``fonts.css`` (url() relatives) et les fichiers de police dans ``target``."""
+    html = template.read_text(encoding="utf-8")
+    match = PATTERN_FONTS_LINK.search(html)
+    if match is None:
+        raise SystemExit(f"Aucune feuille Google Fonts dans {template}")
+    css = _get(match.group(1).replace("&amp;", "&")).decode("utf-8")
+    target.mkdir(parents=True, exist_ok=True)
+    written = []
+
+    def _download(font: re.Match) -> str:
+        url = font.group(1)
+        suffix = Path(url).suffix or ".ttf"
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16] + suffix
+        path = target / name
+        if not path.is_file():
+            path.write_bytes(_get(url))
+            written.append(path)
+        return f"url({name})"
+
+    (target / "fonts.css").write_text(PATTERN_FONT_URL.sub(_download, css), encoding="utf-8")
+    written.append(target / "fonts.css")
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--template", type=Path, default=DEFAULT_TEMPLATE)
+    parser.add_argument("--target", type=Path, default=FONTS_DIR)
+    args = parser.parse_args()
+    try:
+        for path in fetch_fonts(args.template, args.target):
+            print(path.relative_to(PROJECT_ROOT) if path.is_relative_to(PROJECT_ROOT) else path)
+    except OSError as e:
+        sys.exit(f"Téléchargement impossible: {e}")
+
+
+if __name__ == "__main__":
+    main()
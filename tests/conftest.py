@@ -0,0 +1,18 @@
+import pytest
+
+from app.storage import get_storage
+
+
+@pytest.fixture(autouse=True, scope="session")
+def storage_dirs(tmp_path_factory):
+    """Uploads, artefacts et caches des tests dans un dossier temporaire, hors du projet."""
+    root = tmp_path_factory.mktemp("storage")
+    patch = pytest.MonkeyPatch()
+    patch.setenv("STORAGE_BACKEND", "local")
+    patch.setenv("UPLOAD_DIR", str(root / "uploads"))
+    patch.setenv("OUTPUT_DIR", str(root / "output"))
+    patch.setenv("ASSET_CACHE_DIR", str(root / "cache"))
+    get_storage.cache_clear()
+    yield root
+    get_storage.cache_clear()
+    patch.undo()
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app import admission
+from app.admission import AdmissionController, Overloaded, StageLimiter, TokenBucket
+from app.config import Settings
+
+
+def _request(host="203.0.113.7", headers=None):
+    return Request({
+        "type": "http",
+        "method": "POST",
+        "path": "/generate",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "client": (host, 50000),
+    })
+
+
+def _controller(**overrides):
+    return AdmissionController(Settings(_env_file=None, **overrides))
+
+
+def test_token_bucket_exhaustion_gives_delay():
+    bucket = TokenBucket(rate=1.0, burst=2)
+    assert bucket.take() == 0.0
+    assert bucket.take() == 0.0
+    delay = bucket.take()
+    assert 0.0 < delay <= 1.0
+
+
+def test_token_bucket_without_rate_never_refills():
+    bucket = TokenBucket(rate=0.0, burst=1)
+    assert bucket.take() == 0.0
+    assert bucket.take() == float("inf")
+
+
+def test_check_rate_returns_429_with_retry_after():
+    controller = _controller(rate_limit_per_minute=6, rate_limit_burst=2)
+    controller.check_rate("ip:a")
+    controller.check_rate("ip:a")
+    with pytest.raises(HTTPException) as excinfo:
+        controller.check_rate("ip:a")
+    assert excinfo.value.status_code == 429
+    assert int(excinfo.value.headers["Retry-After"]) >= 1
+    # Un autre client a son propre seau
+    controller.check_rate("ip:b")
+
+
+def test_check_rate_forgets_least_recently_seen_clients(monkeypatch):
+    monkeypatch.setattr(admission, "MAX_CLIENTS", 3)
+    controller = _controller(rate_limit_per_minute=6, rate_limit_burst=1)
+    for client in ("ip:a", "ip:b", "ip:c"):
+        controller.check_rate(client)
+    with pytest.raises(HTTPException):
+        controller.check_rate("ip:a")
+    # Aucun seau n'est plein : le plus ancien (ip:b) est oublié, le nombre reste borné
+    controller.check_rate("ip:d")
+    assert list(controller.buckets) == ["ip:c", "ip:a", "ip:d"]
+    with pytest.raises(HTTPException):
+        controller.check_rate("ip:a")
+
+
+def test_unknown_api_key_does_not_bypass_ip_limit():
+    controller = _controller(api_keys=["secret"])
+    assert controller.client_id(_request(headers={"X-API-Key": "random-1"})) == "ip:203.0.113.7"
+    assert controller.client_id(_request(headers={"X-API-Key": "random-2"})) == "ip:203.0.113.7"
+
+
+def test_configured_api_key_identifies_client_without_exposing_it():
+    controller = _controller(api_keys=["secret", "other"])
+    client = controller.client_id(_request(headers={"X-API-Key": "other"}))
+    assert client == "key:1"
+    assert controller.client_id(_request("198.51.100.1", {"X-API-Key": "other"})) == client
+
+
+def test_api_key_ignored_when_none_configured():
+    controller = _controller()
+    assert controller.client_id(_request(headers={"X-API-Key": "secret"})) == "ip:203.0.113.7"
+
+
+def test_stage_limiter_rejects_when_full_without_waiting():
+    async def scenario():
+        limiter = StageLimiter("extract", limit=1, max_queue=4, max_wait=5.0)
+        await limiter.acquire()
+        with pytest.raises(Overloaded):
+            await limiter.acquire(wait=False)
+        limiter.release(0.1)
+        await limiter.acquire(wait=False)
+        assert limiter.stats()["rejected"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_stage_limiter_hands_slot_to_waiter():
+    async def scenario():
+        limiter = StageLimiter("pdf", limit=1, max_queue=4, max_wait=5.0)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.stats()["queued"] == 1
+        limiter.release(0.1)
+        await waiter
+        assert limiter.active == 1 and not limiter.waiters
+
+    asyncio.run(scenario())
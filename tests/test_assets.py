@@ -0,0 +1,38 @@
+import pytest
+
+from app.generator import assets
+from app.storage import get_storage
+
+
+@pytest.fixture
+def listing(monkeypatch):
+    """Compte les listages du stockage et repart d'un inventaire vide."""
+    monkeypatch.setattr(assets, "_listed_at", None)
+    monkeypatch.setattr(assets, "_listing", set())
+    storage = get_storage("output")
+    calls = []
+    original = type(storage).list
+    monkeypatch.setattr(type(storage), "list", lambda self, prefix="": calls.append(prefix) or original(self, prefix))
+    return calls
+
+
+def test_built_assets_are_served_without_listing(listing):
+    name = assets.get_stylesheets(assets.THEMES[0]).theme_name
+    assert assets.get_asset(name)
+    assert listing == []
+
+
+def test_unknown_names_do_not_reach_storage(listing, monkeypatch):
+    storage = get_storage("output")
+    monkeypatch.setattr(type(storage), "read_text", lambda *args: pytest.fail("lecture inattendue"))
+    for i in range(50):
+        assert assets.get_asset(f"theme-x.{i:012x}.css") is None
+    assert assets.get_asset("../.env") is None
+    assert listing == ["assets/"]
+
+
+def test_previous_versions_are_read_from_storage(listing):
+    name = "infographic.0123456789ab.css"
+    get_storage("output").write_text(assets.ASSETS_KEY_PREFIX + name, "body {}")
+    assert assets.get_asset(name) == "body {}"
+    assert len(listing) == 1
@@ -0,0 +1,59 @@
+from app.analyzer.boilerplate import BoilerplateFilter
+from app.models import ExtractedChunk
+
+
+def _pages(texts, kind="page"):
+    return [ExtractedChunk(index=i, kind=kind, text=text) for i, text in enumerate(texts, start=1)]
+
+
+def _run(chunks, **kwargs):
+    boilerplate = BoilerplateFilter(warmup=3, **kwargs)
+    return [chunk.text for chunk in boilerplate.filter(chunks)], boilerplate
+
+
+def test_removes_repeated_header_and_page_numbers():
+    texts = [f"Rapport annuel\nContenu propre à la page {n}\nPage {n} / 8" for n in range(1, 9)]
+    cleaned, boilerplate = _run(_pages(texts))
+    assert cleaned == [f"Contenu propre à la page {n}" for n in range(1, 9)]
+    assert boilerplate.removed_bytes > 0
+
+
+def test_bare_page_numbers_are_removed():
+    texts = [f"Texte {n}\n{n}" for n in range(1, 7)]
+    cleaned, _ = _run(_pages(texts))
+    assert cleaned == [f"Texte {n}" for n in range(1, 7)]
+
+
+def test_repeated_numeric_lines_with_different_values_survive():
+    amounts = ["1 200 €", "980 €", "4 500 €", "75 €", "310 €", "12 000 €"]
+    texts = [f"Rapport annuel\nTotal : {amount}\nCroissance 12,{n} %" for n, amount in enumerate(amounts)]
+    cleaned, _ = _run(_pages(texts))
+    assert cleaned == [f"Total : {amount}\nCroissance 12,{n} %" for n, amount in enumerate(amounts)]
+
+
+def test_identical_figures_are_kept():
+    texts = [f"Section {n}\n100 %\n1 250,00 €" for n in range(6)]
+    cleaned, _ = _run(_pages(texts))
+    assert all("100 %" in text and "1 250,00 €" in text for text in cleaned)
+
+
+def test_sections_and_slides_are_not_filtered():
+    texts = [f"Mentions légales\nParagraphe {n}" for n in range(6)]
+    for kind in ("section", "slide"):
+        cleaned, boilerplate = _run(_pages(texts, kind))
+        assert cleaned == texts
+        assert boilerplate.removed_bytes == 0
+
+
+def test_order_is_preserved_with_mixed_kinds():
+    chunks = _pages([f"En-tête\nPage {n}" for n in range(1, 5)])
+    chunks.insert(1, ExtractedChunk(index=99, kind="section", text="En-tête"))
+    result = list(BoilerplateFilter(warmup=3).filter(chunks))
+    assert [chunk.index for chunk in result] == [1, 99, 2, 3, 4]
+    assert result[1].text == "En-tête"
+
+
+def test_page_reference_in_running_header_is_neutralised():
+    texts = [f"Rapport annuel — Page {n} / 8\nContenu {n}" for n in range(1, 9)]
+    cleaned, _ = _run(_pages(texts))
+    assert cleaned == [f"Contenu {n}" for n in range(1, 9)]
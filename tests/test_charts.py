@@ -0,0 +1,60 @@
+import math
+
+import pytest
+
+from app.design.theme import THEMES
+from app.generator import charts
+from app.generator.charts import parse_chart_value, render_bar_chart_svg
+from app.generator.infographic_generator import generate_infographic_html
+from app.models import DocumentAnalysis
+
+
+@pytest.mark.parametrize("raw", ["nan", "NaN", "inf", "-inf", "1e999", float("nan")])
+def test_parse_chart_value_rejects_non_finite(raw):
+    assert parse_chart_value(raw) == 0.0
+
+
+def test_parse_chart_value_parses_french_numbers():
+    assert parse_chart_value("1 234,5") == 1234.5
+    assert parse_chart_value("15%") == 15.0
+    assert parse_chart_value("abc") == 0.0
+
+
+def test_svg_and_thumbnail_parse_percentages_alike(monkeypatch):
+    from app.generator import thumbnail
+    analysis = DocumentAnalysis(title="t", categories_for_chart={"a": "15%", "b": "5 %"})
+    html = generate_infographic_html(analysis, THEMES[0])
+    assert html.count("<rect") == 2
+    parsed = []
+    monkeypatch.setattr(thumbnail, "parse_chart_value", lambda v: parsed.append(parse_chart_value(v)) or parsed[-1])
+    thumbnail.render_thumbnail(analysis, THEMES[0])
+    assert parsed == [15.0, 5.0]
+
+
+def test_bar_chart_drops_non_finite_values():
+    svg = render_bar_chart_svg(["a", "b", "c", "d"], [float("nan"), 10.0, math.inf, 4.0], THEMES[0])
+    assert svg.startswith("<svg")
+    assert "nan" not in svg.lower() and "inf" not in svg.lower()
+    assert svg.count("<rect") == 2
+
+
+def test_bar_chart_with_only_non_finite_values_is_empty():
+    assert render_bar_chart_svg(["a", "b"], [float("nan"), -math.inf], THEMES[0]) == ""
+
+
+def test_nice_step_covers_max_value():
+    for top in (0.3, 1.0, 7.0, 42.0, 1e6):
+        step = charts._nice_step(top)
+        assert step * charts.GRID_LINES >= top
+
+
+def test_infographic_renders_with_nan_chart_values():
+    analysis = DocumentAnalysis(title="Rapport", categories_for_chart={"Ventes": "nan", "Coûts": "12,5"})
+    html = generate_infographic_html(analysis, THEMES[0])
+    assert "<svg" in html
+
+
+def test_thumbnail_renders_with_non_finite_chart_values():
+    from app.generator.thumbnail import render_thumbnail
+    analysis = DocumentAnalysis(title="Rapport", categories_for_chart={"Ventes": "inf", "Coûts": "nan"})
+    assert render_thumbnail(analysis, THEMES[0]).startswith(b"\x89PNG")
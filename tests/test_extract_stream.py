@@ -0,0 +1,134 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import admission
+from app.admission import AdmissionController, acquire_slot
+from app.config import Settings
+from app.extractors import register_extractor
+from app.extractors.base import BaseExtractor
+from app.main import app
+from app.models import ExtractedChunk, ExtractedContent
+
+
+class ProbeExtractor(BaseExtractor):
+    """Relève l'occupation de l'étape ``extract`` pendant la production de chaque fragment."""
+
+    def __init__(self):
+        self.active: list[int] = []
+
+    @property
+    def supported_extensions(self) -> list[str]:
+        return [".probe"]
+
+    def extract(self, source) -> ExtractedContent:
+        return ExtractedContent(raw_text="")
+
+    def iter_chunks(self, source):
+        for index in range(1, 4):
+            self.active.append(admission.get_admission().stages["extract"].active)
+            yield ExtractedChunk(index=index, text=f"Fragment {index}")
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    monkeypatch.setenv("PERSIST_UPLOADS", "false")
+    controller = AdmissionController(Settings(
+        _env_file=None, extract_concurrency=1, rate_limit_per_minute=600, rate_limit_burst=100,
+    ))
+    monkeypatch.setattr(admission, "_controller", controller)
+    return controller
+
+
+@pytest.fixture
+def probe():
+    extractor = ProbeExtractor()
+    register_extractor(".probe", extractor)
+    return extractor
+
+
+def _upload():
+    return {"file": ("doc.probe", b"contenu")}
+
+
+def test_stream_holds_extract_slot_until_body_is_sent(controller, probe):
+    with TestClient(app) as client:
+        response = client.post("/extract-text?stream=true", files=_upload())
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["type"] for line in lines] == ["header", "chunk", "chunk", "chunk", "done"]
+    # La place est tenue pendant toute l'extraction en flux, puis rendue
+    assert probe.active == [1, 1, 1]
+    assert controller.stages["extract"].active == 0
+
+
+def test_non_stream_releases_extract_slot(controller, probe):
+    with TestClient(app) as client:
+        response = client.post("/extract-text", files=_upload())
+    assert response.status_code == 200
+    assert response.json()["text"] == "Fragment 1\n\nFragment 2\n\nFragment 3"
+    assert probe.active == [1, 1, 1]
+    assert controller.stages["extract"].active == 0
+
+
+def test_stream_rejected_while_slot_is_taken(controller, probe):
+    controller.stages["extract"].max_queue = 0
+    with TestClient(app) as client:
+        # Place occupée par un autre flux en cours
+        client.portal.call(acquire_slot, _scope_request(), "extract")
+        response = client.post("/extract-text?stream=true", files=_upload())
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+    assert probe.active == []
+
+
+def test_invalid_request_releases_slot(controller):
+    with TestClient(app) as client:
+        response = client.post("/extract-text?stream=true&pages=5-1", files=_upload())
+    assert response.status_code == 400
+    assert controller.stages["extract"].active == 0
+
+
+def test_rate_limit_applies_to_stream(monkeypatch, probe):
+    monkeypatch.setenv("PERSIST_UPLOADS", "false")
+    controller = AdmissionController(Settings(_env_file=None, rate_limit_per_minute=1, rate_limit_burst=1))
+    monkeypatch.setattr(admission, "_controller", controller)
+    with TestClient(app) as client:
+        assert client.post("/extract-text?stream=true", files=_upload()).status_code == 200
+        response = client.post("/extract-text?stream=true", files=_upload())
+    assert response.status_code == 429
+    assert controller.stages["extract"].active == 0
+
+
+def _scope_request():
+    from starlette.requests import Request
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": [], "client": ("10.0.0.9", 1)})
+
+
+def test_stream_starts_before_upload_is_persisted(monkeypatch, controller, probe):
+    import threading
+    from app import main
+
+    extraction_started = threading.Event()
+    persisted = []
+
+    def slow_persist(key, content):
+        # Ne se termine qu'une fois le flux commencé : attendre l'écriture avant la
+        # réponse bloquerait ici jusqu'au délai
+        persisted.append(extraction_started.wait(timeout=5))
+
+    class SignallingExtractor(ProbeExtractor):
+        def iter_chunks(self, source):
+            extraction_started.set()
+            yield from super().iter_chunks(source)
+
+    monkeypatch.setenv("PERSIST_UPLOADS", "true")
+    monkeypatch.setattr(main, "_persist_upload", slow_persist)
+    register_extractor(".probe", SignallingExtractor())
+    with TestClient(app) as client:
+        response = client.post("/extract-text?stream=true", files=_upload())
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[-1]["type"] == "done"
+    # L'écriture s'est terminée (avant la ligne done) après le début de l'extraction
+    assert persisted == [True]
@@ -0,0 +1,53 @@
+import asyncio
+import io
+
+import pytest
+
+docx = pytest.importorskip("docx")
+
+from app.analyzer import analyze_content, analyze_content_stream  # noqa: E402
+from app.extractors.docx_extractor import DocxExtractor  # noqa: E402
+
+
+@pytest.fixture
+def report() -> bytes:
+    document = docx.Document()
+    document.add_heading("Rapport d'activité", level=1)
+    document.add_heading("Contexte du marché", level=2)
+    document.add_paragraph("En 2022, le marché a progressé de 12 % malgré la hausse des coûts.")
+    document.add_heading("Résultats financiers", level=1)
+    document.add_heading("Chiffre d'affaires", level=2)
+    document.add_paragraph("Le chiffre d'affaires atteint 4,5 millions d'euros en 2023.")
+    document.add_paragraph("La marge opérationnelle progresse de 3 points sur l'année.")
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "")
+
+
+def test_stream_analysis_matches_full_analysis(report):
+    extractor = DocxExtractor()
+    full = asyncio.run(analyze_content(extractor.extract(report)))
+    streamed = asyncio.run(analyze_content_stream(extractor.iter_chunks(report)))
+
+    assert streamed.structure == full.structure == [
+        "Rapport d'activité",
+        "Contexte du marché",
+        "Résultats financiers",
+        "Chiffre d'affaires",
+    ]
+    assert streamed.title == full.title == "Rapport d'activité"
+    assert {idea.text for idea in streamed.key_ideas} == {idea.text for idea in full.key_ideas}
+    assert streamed.timeline == full.timeline
+    # Le contexte d'un chiffre s'arrête à la fin de son fragment : on compare libellés et valeurs
+    assert [(f.label, f.value) for f in streamed.key_figures] == [(f.label, f.value) for f in full.key_figures]
+    assert streamed.raw_text == full.raw_text
+
+
+def test_heading_only_chunk_is_kept(report):
+    chunks = list(DocxExtractor().iter_chunks(report))
+    assert chunks[0].title == "Rapport d'activité" and chunks[0].text == ""
@@ -0,0 +1,54 @@
+import pytest
+
+from app.config import Settings
+from app.generator import pdf_fetcher
+from app.generator.assets import THEMES, get_stylesheets
+from app.generator.pdf_fetcher import BlockedResourceError, PdfUrlFetcher
+
+
+@pytest.fixture
+def fetcher(tmp_path, monkeypatch):
+    """Fetcher avec un hôte autorisé, des images et des polices dans un dossier temporaire."""
+    images, fonts = tmp_path / "project", tmp_path / "fonts"
+    images.mkdir()
+    fonts.mkdir()
+    (images / "6.png").write_bytes(b"png")
+    (images / ".env").write_text("SECRET=1")
+    (images / "uploads").mkdir()
+    (images / "uploads" / "doc.png").write_bytes(b"upload")
+    (fonts / "inter.woff2").write_bytes(b"font")
+    monkeypatch.setattr(pdf_fetcher, "IMAGES_DIR", images)
+    monkeypatch.setattr(pdf_fetcher, "FONTS_DIR", fonts)
+    settings = Settings(pdf_allowed_hosts=["CDN.example.com"], asset_cache_dir=tmp_path / "cache")
+    return PdfUrlFetcher(settings)
+
+
+def test_hosts_outside_the_allow_list_are_blocked(fetcher, monkeypatch):
+    monkeypatch.setattr(fetcher, "_fetch_remote", lambda url: {"string": url.encode()})
+    assert fetcher("https://cdn.example.com/logo.png")["string"] == b"https://cdn.example.com/logo.png"
+    for url in ("https://evil.example.com/x.png", "http://169.254.169.254/latest", "ftp://cdn.example.com/x"):
+        with pytest.raises(BlockedResourceError):
+            fetcher(url)
+
+
+def test_images_and_assets_are_mapped_to_local_files(fetcher, tmp_path):
+    assert fetcher("file:///images/6.png")["string"] == b"png"
+    assert fetcher((tmp_path / "fonts" / "inter.woff2").as_uri())["string"] == b"font"
+    sheets = get_stylesheets(THEMES[0])
+    result = fetcher("file://" + sheets.theme_url)
+    assert result["mime_type"] == "text/css"
+    assert result["string"].decode("utf-8") == sheets.theme_css
+
+
+@pytest.mark.parametrize("path", [
+    "/images/.env",
+    "/images/../project/.env",
+    "/images/uploads/doc.png",
+    "/images/missing.png",
+    "/assets/theme-x.0123456789ab.css",
+])
+def test_other_local_files_are_blocked(fetcher, tmp_path, path):
+    with pytest.raises(BlockedResourceError):
+        fetcher("file://" + path)
+    with pytest.raises(BlockedResourceError):
+        fetcher((tmp_path / "project" / ".env").as_uri())
@@ -0,0 +1,99 @@
+import io
+
+import pytest
+
+pptx = pytest.importorskip("pptx")
+from pptx.util import Inches  # noqa: E402
+
+from app.extractors import pptx_extractor  # noqa: E402
+from app.extractors.pptx_extractor import PptxExtractor  # noqa: E402
+
+
+def _deck() -> bytes:
+    prs = pptx.Presentation()
+    prs.core_properties.title = "Bilan 2024"
+
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = "Résultats"
+    slide.placeholders[1].text = "Chiffre d'affaires en hausse"
+    slide.notes_slide.notes_text_frame.text = "Insister sur la marge"
+
+    slide = prs.slides.add_slide(prs.slide_layouts[5])
+    slide.shapes.title.text = "Ventes par région"
+    table = slide.shapes.add_table(2, 2, Inches(1), Inches(2), Inches(4), Inches(1)).table
+    for r, row in enumerate([("Région", "Ventes"), ("Nord", "120")]):
+        for c, value in enumerate(row):
+            table.cell(r, c).text = value
+
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    group = slide.shapes.add_group_shape()
+    box = group.shapes.add_textbox(Inches(1), Inches(1), Inches(3), Inches(1))
+    box.text_frame.text = "Texte dans un groupe"
+
+    prs.slides.add_slide(prs.slide_layouts[6])  # diapositive vide, ignorée
+
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def deck():
+    return _deck()
+
+
+def test_title_placeholder_and_notes(deck):
+    chunks = list(PptxExtractor().iter_chunks(deck))
+    assert chunks[0].title == "Résultats"
+    assert chunks[0].document_title == "Bilan 2024"
+    assert "Chiffre d'affaires en hausse" in chunks[0].text
+    assert "Insister sur la marge" in chunks[0].text
+
+
+def test_table_rows(deck):
+    chunk = list(PptxExtractor().iter_chunks(deck))[1]
+    assert chunk.title == "Ventes par région"
+    assert "Région | Ventes" in chunk.text.splitlines()
+    assert "Nord | 120" in chunk.text.splitlines()
+
+
+def test_group_shapes_and_empty_slides(deck):
+    chunks = list(PptxExtractor().iter_chunks(deck))
+    assert [chunk.index for chunk in chunks] == [1, 2, 3]
+    assert chunks[2].title == "Slide 3"
+    assert chunks[2].text == "Texte dans un groupe"
+
+
+def test_extract_matches_chunks(deck):
+    content = PptxExtractor().extract(deck)
+    assert content.title == "Bilan 2024"
+    assert [section["title"] for section in content.sections] == ["Résultats", "Ventes par région", "Slide 3"]
+
+
+def test_python_pptx_fallback(deck, monkeypatch):
+    def broken(zf):
+        raise KeyError("ppt/presentation.xml")
+
+    monkeypatch.setattr(pptx_extractor, "_slide_parts", broken)
+    chunks = list(PptxExtractor().iter_chunks(deck))
+    assert chunks and chunks[0].document_title == "Bilan 2024"
+    assert any("Chiffre d'affaires en hausse" in chunk.text for chunk in chunks)
+    assert PptxExtractor().extract(deck).sections[0]["title"] == "Slide 1"
+
+
+def test_package_closed_when_slide_list_fails(deck, monkeypatch):
+    closed = []
+
+    class TrackedZipFile(pptx_extractor.zipfile.ZipFile):
+        def close(self):
+            closed.append(True)
+            super().close()
+
+    def broken(zf):
+        raise RuntimeError("présentation illisible")
+
+    monkeypatch.setattr(pptx_extractor.zipfile, "ZipFile", TrackedZipFile)
+    monkeypatch.setattr(pptx_extractor, "_slide_parts", broken)
+    with pytest.raises(RuntimeError):
+        list(PptxExtractor().iter_chunks(deck))
+    assert closed
@@ -0,0 +1,21 @@
+import importlib
+
+import pytest
+
+from app.extractors.registry import BUILTIN_EXTRACTORS, supported_extensions
+from app.main import ALLOWED_EXTENSIONS
+
+
+def test_allowed_upload_extensions_have_an_extractor():
+    assert ALLOWED_EXTENSIONS <= set(supported_extensions())
+
+
+@pytest.mark.parametrize("target", sorted(set(BUILTIN_EXTRACTORS.values())))
+def test_builtin_extractors_declare_their_registered_extensions(target):
+    module_name, _, attr = target.partition(":")
+    try:
+        extractor = getattr(importlib.import_module(module_name), attr)()
+    except ImportError as e:
+        pytest.skip(f"dépendance absente: {e}")
+    registered = {ext for ext, spec in BUILTIN_EXTRACTORS.items() if spec == target}
+    assert registered == set(extractor.supported_extensions)
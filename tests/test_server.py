@@ -0,0 +1,32 @@
+import pytest
+
+import app.storage
+from app import server
+from app.generator import assets
+
+
+@pytest.fixture
+def storage_calls(monkeypatch):
+    """Accès au stockage, avec des feuilles encore jamais enregistrées."""
+    monkeypatch.setattr(assets, "_persisted", set())
+    calls = []
+    get_storage = app.storage.get_storage
+    fake = lambda area: calls.append(area) or get_storage(area)
+    fake.cache_clear = get_storage.cache_clear
+    monkeypatch.setattr(app.storage, "get_storage", fake)
+    yield calls
+    assets.enable_persistence(True)
+
+
+def test_preload_does_not_touch_storage(storage_calls):
+    server.preload()
+    assert storage_calls == []
+    assert assets._persisted == set()
+
+
+def test_workers_persist_stylesheets_after_fork(storage_calls):
+    server.preload()
+    server.post_fork(None, None)
+    sheets = assets.get_stylesheets(assets.THEMES[0])
+    assert storage_calls == ["output"]
+    assert {sheets.base_name, sheets.theme_name} <= assets._persisted
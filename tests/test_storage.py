@@ -0,0 +1,193 @@
+import os
+import time
+
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+
+from app.storage import CachedStorage, LocalStorage, S3Storage, storage_response
+from app.storage.responses import _parse_range
+
+BODY = b"0123456789" * 10
+
+
+@pytest.fixture
+def local(tmp_path):
+    storage = LocalStorage(tmp_path / "objects")
+    storage.write_bytes("doc/a.bin", BODY)
+    return storage
+
+
+def test_local_storage_reads_ranges(local):
+    assert local.read_bytes("doc/a.bin") == BODY
+    assert b"".join(local.iter_bytes("doc/a.bin", 5, 12)) == BODY[5:12]
+    assert b"".join(local.iter_bytes("doc/a.bin", 95)) == BODY[95:]
+    assert b"".join(local.iter_bytes("doc/a.bin", 200, 300)) == b""
+    with pytest.raises(FileNotFoundError):
+        local.iter_bytes("doc/missing.bin")
+
+
+def test_local_storage_write_is_atomic_and_listed(local):
+    info = local.write_text("doc/b.txt", "é")
+    assert info == local.stat("doc/b.txt") and info.size == 2
+    assert local.list("doc/") == ["doc/a.bin", "doc/b.txt"]
+    assert not [name for name in os.listdir(local.root / "doc") if name.startswith(".tmp-")]
+    local.delete("doc/b.txt")
+    assert local.stat("doc/b.txt") is None
+    with pytest.raises(ValueError):
+        local.stat("../outside")
+
+
+class CountingStorage(LocalStorage):
+    """Stockage « distant » qui compte ses accès."""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.stats = 0
+        self.reads = 0
+
+    def stat(self, key):
+        self.stats += 1
+        return super().stat(key)
+
+    def iter_bytes(self, key, start=0, end=None):
+        self.reads += 1
+        return super().iter_bytes(key, start, end)
+
+
+def test_cached_storage_revalidates_after_ttl(tmp_path):
+    backend = CountingStorage(tmp_path / "remote")
+    backend.write_bytes("a.bin", b"v1")
+    backend.stats = 0
+    cache = CachedStorage(backend, tmp_path / "cache", ttl=60)
+    assert cache.read_bytes("a.bin") == b"v1"
+    assert cache.read_bytes("a.bin") == b"v1"
+    assert backend.reads == 1 and backend.stats == 1
+
+    # Réécrit ailleurs : servi depuis la copie jusqu'à l'expiration du ttl
+    time.sleep(0.01)
+    backend.write_bytes("a.bin", b"v2")
+    assert cache.read_bytes("a.bin") == b"v1"
+    cache.ttl = 0
+    assert cache.read_bytes("a.bin") == b"v2"
+    assert backend.reads == 2
+
+    # Copie à jour : revalidée par stat, sans relecture
+    assert cache.read_bytes("a.bin") == b"v2"
+    assert backend.reads == 2
+
+    backend.delete("a.bin")
+    assert cache.stat("a.bin") is None
+
+
+def test_cached_storage_evicts_least_recently_used(tmp_path):
+    backend = LocalStorage(tmp_path / "remote")
+    cache = CachedStorage(backend, tmp_path / "cache", ttl=60, max_bytes=25)
+    for index, key in enumerate(["a", "b", "c"]):
+        backend.write_bytes(key, bytes(10))
+        cache.read_bytes(key)
+        # Horodatages LRU distincts, du plus ancien au plus récent
+        os.utime(cache.files.root / cache._name(key), (index, index))
+    cache.read_bytes("a")
+    backend.write_bytes("d", bytes(10))
+    cache.read_bytes("d")
+    kept = {key for key in "abcd" if cache.files.stat(cache._name(key)) is not None}
+    assert kept == {"a", "d"}
+
+
+def test_cached_storage_writes_through(tmp_path):
+    backend = CountingStorage(tmp_path / "remote")
+    cache = CachedStorage(backend, tmp_path / "cache", ttl=60)
+    info = cache.write_bytes("x/y.txt", b"data")
+    assert backend.read_bytes("x/y.txt") == b"data"
+    reads = backend.reads
+    assert cache.stat("x/y.txt") == info
+    assert cache.read_bytes("x/y.txt") == b"data"
+    assert backend.reads == reads
+    assert cache.list("x/") == ["x/y.txt"]
+
+
+def test_s3_storage():
+    pytest.importorskip("boto3")
+    moto = pytest.importorskip("moto")
+    with moto.mock_aws():
+        storage = S3Storage("bucket", prefix="app/output/", region="us-east-1", access_key="a", secret_key="b")
+        storage.client.create_bucket(Bucket="bucket")
+        assert storage.stat("doc/a.bin") is None
+        with pytest.raises(FileNotFoundError):
+            storage.iter_bytes("doc/a.bin")
+
+        info = storage.write_stream("doc/a.bin", [BODY[:50], BODY[50:]])
+        assert info.size == len(BODY) and info == storage.stat("doc/a.bin")
+        assert storage.read_bytes("doc/a.bin") == BODY
+        assert b"".join(storage.iter_bytes("doc/a.bin", 5, 12)) == BODY[5:12]
+        assert b"".join(storage.iter_bytes("doc/a.bin", 95)) == BODY[95:]
+        assert b"".join(storage.iter_bytes("doc/a.bin", 7, 7)) == b""
+        storage.write_text("doc/b.txt", "b")
+        assert storage.list("doc/") == ["doc/a.bin", "doc/b.txt"]
+        assert storage.client.head_object(Bucket="bucket", Key="app/output/doc/b.txt")["ContentType"] == "text/plain"
+
+        storage.delete("doc/a.bin")
+        assert storage.stat("doc/a.bin") is None
+        with pytest.raises(ValueError):
+            storage.stat("../a")
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-9", (0, 10)),
+    ("bytes=90-", (90, 100)),
+    ("bytes=-5", (95, 100)),
+    ("bytes=-500", (0, 100)),
+    ("bytes=95-500", (95, 100)),
+    ("bytes=5-2", None),
+    ("bytes=0-1,5-6", None),
+    ("bytes=-", None),
+    ("items=0-1", None),
+])
+def test_parse_range(header, expected):
+    assert _parse_range(header, 100) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=150-160", "bytes=-0"])
+def test_parse_range_outside_the_object(header):
+    with pytest.raises(HTTPException) as error:
+        _parse_range(header, 100)
+    assert error.value.status_code == 416
+    assert error.value.headers["Content-Range"] == "bytes */100"
+
+
+@pytest.fixture
+def client(local):
+    app = FastAPI()
+
+    @app.get("/files/{key:path}")
+    def serve(key: str, request: Request):
+        return storage_response(request, local, key, "application/octet-stream")
+
+    return TestClient(app)
+
+
+def test_storage_response_serves_ranges_and_etags(client, local):
+    response = client.get("/files/doc/a.bin")
+    assert response.status_code == 200 and response.content == BODY
+    etag = response.headers["etag"]
+    assert etag == f'"{local.stat("doc/a.bin").etag}"'
+    assert response.headers["accept-ranges"] == "bytes"
+
+    response = client.get("/files/doc/a.bin", headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206 and response.content == BODY[10:20]
+    assert response.headers["content-range"] == "bytes 10-19/100"
+
+    assert client.get("/files/doc/a.bin", headers={"If-None-Match": etag}).status_code == 304
+
+    # If-Range périmé : l'objet entier
+    response = client.get("/files/doc/a.bin", headers={"Range": "bytes=10-19", "If-Range": '"old"'})
+    assert response.status_code == 200 and response.content == BODY
+
+
+def test_storage_response_ignores_invalid_ranges(client):
+    response = client.get("/files/doc/a.bin", headers={"Range": "bytes=5-2"})
+    assert response.status_code == 200 and response.content == BODY
+    response = client.get("/files/doc/a.bin", headers={"Range": "bytes=100-"})
+    assert response.status_code == 416
+    assert client.get("/files/doc/missing.bin").status_code == 404
@@ -0,0 +1,41 @@
+import time
+
+from app.analyzer import summarizer
+from app.analyzer.summarizer import ExtractiveSummarizer, summarize
+
+
+def _document(paragraphs: int) -> str:
+    words = "marché croissance entreprise données analyse résultats stratégie clients".split()
+    return "\n\n".join(
+        " ".join(
+            f"Paragraphe {p} phrase {s} : " + " ".join(words[(p + s + i) % len(words)] for i in range(10)) + "."
+            for s in range(5)
+        )
+        for p in range(paragraphs)
+    )
+
+
+def test_small_text_keeps_every_sentence():
+    text = _document(20)
+    assert len(ExtractiveSummarizer(text).sentences) == 100
+
+
+def test_large_text_is_sampled_before_splitting(monkeypatch):
+    text = _document(40_000)
+    assert len(text) > summarizer.MAX_SAMPLE_CHARS
+    calls = []
+    split = summarizer._split_sentences
+    monkeypatch.setattr(summarizer, "_split_sentences", lambda t: calls.append(len(t)) or split(t))
+
+    started = time.perf_counter()
+    sentences = ExtractiveSummarizer(text).sentences
+    elapsed = time.perf_counter() - started
+
+    assert max(calls) <= summarizer.WINDOW_CHARS
+    assert 0 < len(sentences) <= summarizer.MAX_SENTENCES
+    # Échantillon réparti sur tout le document, sans phrase coupée par les fenêtres
+    assert sentences[0].startswith("Paragraphe 0 phrase 0")
+    assert sentences[-1].startswith("Paragraphe 39999 phrase 4")
+    assert all(s.startswith("Paragraphe ") and s.endswith(".") for s in sentences)
+    assert elapsed < 5
+    assert summarize(text)
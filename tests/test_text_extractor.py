@@ -0,0 +1,55 @@
+import codecs
+
+from app.extractors import text_extractor
+from app.extractors.text_extractor import SAMPLE_SIZE, TextExtractor, _detect_encoding
+
+
+def test_bom_detection():
+    assert _detect_encoding(codecs.BOM_UTF8 + "café".encode()) == "utf-8-sig"
+    assert _detect_encoding("café".encode("utf-16")) == "utf-16"
+
+
+def test_short_cp1252_file():
+    data = "café\n".encode("cp1252")
+    assert _detect_encoding(data) == "cp1252"
+    content = TextExtractor().extract(data)
+    assert content.raw_text == "café"
+
+
+def test_cp1252_error_at_end_of_partial_sample():
+    # « € » en cp1252 (0x80) ne peut commencer aucune séquence UTF-8
+    sample = b"a" * (SAMPLE_SIZE - 1) + "€".encode("cp1252")
+    assert _detect_encoding(sample) == "cp1252"
+
+
+def test_multibyte_character_split_at_sample_boundary():
+    data = b"a" * (SAMPLE_SIZE - 1) + "é suite\n".encode("utf-8")
+    assert _detect_encoding(data[:SAMPLE_SIZE]) == "utf-8"
+    content = TextExtractor().extract(data)
+    assert content.raw_text.endswith("aé suite")
+    assert "�" not in content.raw_text
+
+
+def test_utf8_file():
+    data = "# Titre\nÉté 2024 : 12 % de hausse\n".encode("utf-8")
+    content = TextExtractor().extract(data)
+    assert content.title == "Titre"
+    assert content.sections == [{"title": "Titre", "content": ["Été 2024 : 12 % de hausse"]}]
+    assert not content.truncated
+
+
+def test_raw_text_truncation_flag(monkeypatch):
+    monkeypatch.setattr(text_extractor, "MAX_RAW_CHARS", 50)
+    monkeypatch.setattr(text_extractor, "MAX_BLOCK_CHARS", 30)
+    data = ("ligne de texte assez longue\n" * 10).encode()
+    content = TextExtractor().extract(data)
+    assert content.truncated
+    assert len(content.raw_text) <= 50
+    # En flux, rien n'est perdu : les blocs trop longs sont découpés
+    chunks = list(TextExtractor().iter_chunks(data))
+    assert len(chunks) > 1
+    assert "".join(chunk.text for chunk in chunks).count("ligne de texte") == 10
+
+
+def test_no_truncation_below_limit():
+    assert not TextExtractor().extract(b"court\n").truncated